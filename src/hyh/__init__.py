@@ -1,9 +1,17 @@
 """Hyh - Autonomous Research Kernel with Thread-Safe Pull Engine."""
 
-from importlib.metadata import PackageNotFoundError, version
 
-try:
-    __version__ = version("hyh")
-except PackageNotFoundError:
-    # Running from source without install
-    __version__ = "0.0.0+dev"
+def __getattr__(name: str) -> str:
+    # importlib.metadata is the most expensive import on the CLI path; resolve
+    # the version on first access so hook invocations never pay for it.
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("hyh")
+        except PackageNotFoundError:
+            # Running from source without install
+            value = "0.0.0+dev"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,20 +1,69 @@
 import contextlib
-import json
-import queue
 import socket
 import sys
 import threading
+from collections import deque
 from typing import Any, Final
 
+import msgspec
+
+_MAX_BATCH: Final[int] = 64
+_BUFFER_SIZE: Final[int] = 4096
+_NL: Final[bytes] = b"\n"
+_ENCODE_ERRORS: Final = (TypeError, ValueError, RecursionError, msgspec.EncodeError)
+# Backoff while the listener is not up yet; telemetry stays off after the last retry
+_CONNECT_RETRIES: Final[int] = 3
+_CONNECT_BACKOFF: Final[float] = 0.1
+_CONNECT_BACKOFF_MAX: Final[float] = 5.0
+_CLOSE_GRACE: Final[float] = 0.5
+
+
+def _sendmsg_all(sock: socket.socket, iov: list[bytes]) -> None:
+    if not hasattr(sock, "sendmsg"):
+        sock.sendall(b"".join(iov))
+        return
+
+    views = [memoryview(buf) for buf in iov]
+    start = 0
+    while start < len(views):
+        sent = sock.sendmsg(views[start:])
+        # Skip fully written buffers, then trim the partially written one
+        while start < len(views) and sent >= len(views[start]):
+            sent -= len(views[start])
+            start += 1
+        if sent:
+            views[start] = views[start][sent:]
+
 
 class ACPEmitter:
-    __slots__ = ("_disabled_event", "_host", "_port", "_queue", "_thread", "_warned_event")
+    __slots__ = (
+        "_buffer",
+        "_closed_event",
+        "_disabled_event",
+        "_host",
+        "_path",
+        "_port",
+        "_sock",
+        "_sock_lock",
+        "_thread",
+        "_wakeup_event",
+        "_warned_event",
+    )
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 9100) -> None:
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 9100, *, path: str | None = None
+    ) -> None:
         self._host: Final[str] = host
         self._port: Final[int] = port
-        self._queue: Final[queue.Queue[dict[str, Any] | None]] = queue.Queue()
+        self._path: Final[str | None] = path
+        # Lock-free: deque append/popleft are atomic; maxlen drops the oldest
+        self._buffer: Final[deque[dict[str, Any] | None]] = deque(maxlen=_BUFFER_SIZE)
+        self._wakeup_event: Final[threading.Event] = threading.Event()
         self._disabled_event: Final[threading.Event] = threading.Event()
+        self._closed_event: Final[threading.Event] = threading.Event()
+        # Published so close() can shut down a send stuck on a stalled peer
+        self._sock: socket.socket | None = None
+        self._sock_lock: Final[threading.Lock] = threading.Lock()
 
         self._warned_event: Final[threading.Event] = threading.Event()
         self._thread: Final[threading.Thread] = threading.Thread(target=self._worker, daemon=True)
@@ -22,48 +71,122 @@ class ACPEmitter:
 
     def emit(self, entry: dict[str, Any]) -> None:
         if not self._disabled_event.is_set():
-            self._queue.put_nowait(entry)
+            self._buffer.append(entry)
+            self._wakeup_event.set()
+
+    def _next(self) -> dict[str, Any] | None:
+        while True:
+            try:
+                return self._buffer.popleft()
+            except IndexError:
+                # Clear before re-checking the buffer so a concurrent emit is never missed
+                self._wakeup_event.wait()
+                self._wakeup_event.clear()
+
+    def _drain(self) -> tuple[list[dict[str, Any]], bool]:
+        # The bool reports whether the shutdown sentinel was reached
+        batch: list[dict[str, Any]] = []
+        entry = self._next()
+        while entry is not None:
+            batch.append(entry)
+            if len(batch) >= _MAX_BATCH:
+                return batch, False
+            try:
+                entry = self._buffer.popleft()
+            except IndexError:
+                return batch, False
+        return batch, True
+
+    def _open_socket(self) -> socket.socket:
+        if self._path is not None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(2.0)
+            if self._path is not None:
+                sock.connect(self._path)
+            else:
+                sock.connect((self._host, self._port))
+                with contextlib.suppress(OSError):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            with contextlib.suppress(OSError):
+                sock.close()
+            raise
+        return sock
+
+    def _connect(self) -> socket.socket | None:
+        for attempt in range(_CONNECT_RETRIES + 1):
+            try:
+                return self._open_socket()
+            except OSError:
+                if attempt == _CONNECT_RETRIES:
+                    return None
+                delay = min(_CONNECT_BACKOFF * 2**attempt, _CONNECT_BACKOFF_MAX)
+                # close() cuts the backoff short instead of stalling shutdown
+                if self._closed_event.wait(delay):
+                    return None
+        return None
 
     def _worker(self) -> None:
         sock: socket.socket | None = None
-        while True:
-            entry = self._queue.get()
-            if entry is None:
-                break
-            if self._disabled_event.is_set():
+        stopping = False
+        while not stopping:
+            batch, stopping = self._drain()
+            if not batch or self._disabled_event.is_set():
                 continue
 
             if sock is None:
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(2.0)
-                    sock.connect((self._host, self._port))
-                except OSError:
+                sock = self._connect()
+                self._publish(sock)
+                if sock is None:
                     self._disabled_event.set()
-
-                    if sock is not None:
-                        with contextlib.suppress(OSError):
-                            sock.close()
-                    sock = None
                     if not self._warned_event.is_set():
                         self._warned_event.set()
-                        msg = f"ACP: Claude Code not available on port {self._port}"
+                        where = self._path if self._path is not None else f"port {self._port}"
+                        msg = f"ACP: Claude Code not available on {where}"
                         print(msg, file=sys.stderr)
                     continue
 
+            payloads: list[bytes] = []
+            for entry in batch:
+                with contextlib.suppress(*_ENCODE_ERRORS):
+                    payloads.append(msgspec.json.encode(entry))
+            if not payloads:
+                continue
+
             try:
-                msg = json.dumps(entry) + "\n"
-                sock.sendall(msg.encode())
+                if self._path is not None:
+                    for payload in payloads:
+                        sock.send(payload)
+                else:
+                    _sendmsg_all(sock, [buf for payload in payloads for buf in (payload, _NL)])
             except OSError:
                 self._disabled_event.set()
+                self._publish(None)
                 with contextlib.suppress(OSError):
                     sock.close()
                 sock = None
 
         if sock:
+            self._publish(None)
             with contextlib.suppress(OSError):
                 sock.close()
 
+    def _publish(self, sock: socket.socket | None) -> None:
+        with self._sock_lock:
+            self._sock = sock
+
     def close(self) -> None:
-        self._queue.put(None)
-        self._thread.join(timeout=1.0)
+        self._closed_event.set()
+        self._buffer.append(None)
+        self._wakeup_event.set()
+        # Let the worker flush, then fail a send that is still blocked
+        self._thread.join(timeout=_CLOSE_GRACE)
+        if self._thread.is_alive():
+            with self._sock_lock:
+                if self._sock is not None:
+                    with contextlib.suppress(OSError):
+                        self._sock.shutdown(socket.SHUT_RDWR)
+            self._thread.join(timeout=_CLOSE_GRACE)
@@ -1,17 +1,16 @@
-import argparse
 import hashlib
 import json
 import os
 import socket
-import subprocess
+import struct
 import sys
 import time
-import uuid
-from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Final
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Final, Protocol, Self
 
-from hyh import demo
+if TYPE_CHECKING:
+    import argparse
 
 
 def get_worker_id() -> str:
@@ -23,24 +22,28 @@ def get_worker_id() -> str:
         username = os.getenv("USER", "default")
         worker_id_file = Path(f"{runtime_dir}/hyh-worker-{username}.id")
 
-    if worker_id_file.exists():
+    try:
+        fd = os.open(worker_id_file, os.O_RDONLY)
         try:
-            worker_id = worker_id_file.read_text().strip()
+            data = os.read(fd, 64)
+        finally:
+            os.close(fd)
+        worker_id = data.decode().strip()
+        if worker_id.startswith("worker-") and len(worker_id) == 19:
+            return worker_id
+    except (OSError, UnicodeDecodeError):
+        pass
 
-            if worker_id.startswith("worker-") and len(worker_id) == 19:
-                return worker_id
-        except OSError:
-            pass
+    import uuid
 
     worker_id = f"worker-{uuid.uuid4().hex[:12]}"
 
     tmp_file = worker_id_file.with_suffix(".tmp")
     try:
+        # No fsync: the runtime dir does not survive a reboot anyway
         fd = os.open(str(tmp_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
         with os.fdopen(fd, "w") as f:
             f.write(worker_id)
-            f.flush()
-            os.fsync(f.fileno())
 
         tmp_file.rename(worker_id_file)
     except OSError:
@@ -49,7 +52,20 @@ def get_worker_id() -> str:
     return worker_id
 
 
-WORKER_ID: Final[str] = get_worker_id()
+_worker_id_cache: str | None = None
+
+
+def _worker_id() -> str:
+    global _worker_id_cache
+    if _worker_id_cache is None:
+        _worker_id_cache = get_worker_id()
+    return _worker_id_cache
+
+
+def __getattr__(name: str) -> str:
+    if name == "WORKER_ID":
+        return _worker_id()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_socket_path(worktree: Path | None = None) -> str:
@@ -68,140 +84,205 @@ def get_socket_path(worktree: Path | None = None) -> str:
     return str(hyh_dir / f"{path_hash}.sock")
 
 
-def spawn_daemon(worktree_root: str, socket_path: str) -> None:
-    import contextlib
-    import tempfile
+# Bytes of daemon stderr kept from before it is ready, for crash reports
+_STARTUP_STDERR_TAIL: Final[int] = 4096
 
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False, suffix=".stderr") as stderr_file:
-        stderr_path = stderr_file.name
 
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False, suffix=".status") as status_file:
-        status_path = status_file.name
+def spawn_daemon(worktree_root: str, socket_path: str) -> None:
+    import contextlib
+    import select
+    import signal
+    import subprocess
 
     try:
-        pid = os.fork()
-        if pid == 0:
-            try:
-                os.setsid()
+        timeout_seconds = int(os.getenv("HYH_TIMEOUT", "5"))
+    except (ValueError, TypeError):
+        timeout_seconds = 5
 
-                daemon_pid = os.fork()
-                if daemon_pid == 0:
-                    try:
-                        null_fd = os.open("/dev/null", os.O_RDWR)
-                        os.dup2(null_fd, 0)
-                        os.dup2(null_fd, 1)
-                        stderr_fd = os.open(stderr_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
-                        os.dup2(stderr_fd, 2)
-                        if null_fd > 2:
-                            os.close(null_fd)
-                        if stderr_fd > 2:
-                            os.close(stderr_fd)
-
-                        os.execv(  # noqa: S606
-                            sys.executable,
-                            [
-                                sys.executable,
-                                "-m",
-                                "hyh.daemon",
-                                socket_path,
-                                worktree_root,
-                            ],
-                        )
-                    except Exception as e:
-                        with contextlib.suppress(Exception):
-                            Path(stderr_path).write_text(str(e))
-                        os._exit(1)
+    # The daemon writes a lone newline once listening, or why it failed
+    ready_r, ready_w = os.pipe()
+    try:
+        # stderr is piped until ready to report crashes before the ready pipe
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "hyh.daemon", socket_path, worktree_root],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+            pass_fds=(ready_w,),
+            env={**os.environ, "HYH_READY_FD": str(ready_w)},
+        )
+    except BaseException:
+        os.close(ready_r)
+        raise
+    finally:
+        os.close(ready_w)
+
+    assert proc.stderr is not None  # Type narrowing
+    stderr_fd = proc.stderr.fileno()
+    stderr_tail = bytearray()
+    watched = [ready_r, stderr_fd]
+    deadline = time.monotonic() + timeout_seconds
+    ready = False
+    status = b""
+    try:
+        # Drain stderr while waiting so a chatty startup cannot fill the pipe
+        while (remaining := deadline - time.monotonic()) > 0:
+            readable = select.select(watched, [], [], remaining)[0]
+            if stderr_fd in readable:
+                if chunk := os.read(stderr_fd, 4096):
+                    stderr_tail += chunk
+                    del stderr_tail[:-_STARTUP_STDERR_TAIL]
                 else:
-                    Path(status_path).write_text(str(daemon_pid))
-                    os._exit(0)
-            except Exception:
-                os._exit(1)
-        else:
-            _, status = os.waitpid(pid, 0)
-            if status != 0:
-                raise RuntimeError("Failed to fork daemon process")
+                    watched.remove(stderr_fd)
+            if ready_r in readable:
+                ready = True
+                status = os.read(ready_r, 4096)
+                break
+    finally:
+        os.close(ready_r)
 
-        daemon_pid_str = Path(status_path).read_text().strip()
-        if not daemon_pid_str:
-            raise RuntimeError("Failed to get daemon PID")
-        daemon_pid = int(daemon_pid_str)
+    if status == b"\n":
+        # proc is the launcher, which has already forked the daemon off to init
+        proc.stderr.close()
+        proc.wait()
+        return
+
+    # The session's group includes a hung forked daemon holding the lock
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(proc.pid, signal.SIGKILL)
+    proc.wait()
+    with proc.stderr:
+        stderr_tail += proc.stderr.read()
+    stderr_lines = stderr_tail.decode(errors="replace").strip().splitlines()
+    detail = f": {stderr_lines[-1]}" if stderr_lines else ""
 
+    if not ready:
+        raise RuntimeError(
+            f"Daemon failed to start (timeout {timeout_seconds}s waiting for socket){detail}"
+        )
+    if status:
+        raise RuntimeError(f"Daemon crashed on startup: {status.decode(errors='replace')}")
+    if proc.returncode:
+        # The launcher itself failed, before it could fork the daemon
+        raise RuntimeError(f"Daemon crashed on startup (exit status {proc.returncode}){detail}")
+    raise RuntimeError(f"Daemon crashed on startup{detail}")
+
+
+_REQ_TAIL: Final[bytes] = b"\n"
+# ensure_ascii stays on so surrogate-escaped argv still encodes
+_encode_request: Final = json.JSONEncoder(separators=(",", ":")).encode
+# Large enough that a full get_state/status reply usually arrives in one read
+_RECV_SIZE: Final[int] = 65536
+
+
+class _Connection:
+    # Newline-delimited RPCs over one daemon connection, on the raw socket fd
+    __slots__ = ("_fd", "_timeout")
+
+    def __init__(self, socket_path: str, timeout: float = 5.0) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
-            timeout_seconds = int(os.getenv("HYH_TIMEOUT", "5"))
-        except (ValueError, TypeError):
-            timeout_seconds = 5
-        iterations = timeout_seconds * 10
+            if sock.gettimeout() is not None:
+                sock.setblocking(True)  # socket.setdefaulttimeout() is in effect
+            seconds = int(timeout)
+            timeval = struct.pack("ll", seconds, int((timeout - seconds) * 1_000_000))
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, timeval)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDTIMEO, timeval)
+            sock.connect(socket_path)
+        except BaseException:
+            sock.close()
+            raise
+        self._fd: Final[int] = sock.detach()
+        self._timeout: Final[float] = timeout
 
-        for _ in range(iterations):
-            try:
-                os.kill(daemon_pid, 0)
-            except OSError as err:
-                stderr_content = ""
-                with contextlib.suppress(Exception):
-                    stderr_content = Path(stderr_path).read_text().strip()
-                raise RuntimeError(f"Daemon crashed on startup: {stderr_content}") from err
-
-            if Path(socket_path).exists():
-                time.sleep(0.05)
-                return
-            time.sleep(0.1)
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
 
+    def close(self) -> None:
+        os.close(self._fd)
+
+    def call(self, request: dict[str, Any]) -> dict[str, Any]:
+        fd = self._fd
+        payload = _encode_request(request).encode()
         try:
-            os.kill(daemon_pid, 0)
-        except OSError as err:
-            stderr_content = ""
-            with contextlib.suppress(Exception):
-                stderr_content = Path(stderr_path).read_text().strip()
-            raise RuntimeError(f"Daemon crashed: {stderr_content}") from err
+            sent = os.writev(fd, [payload, _REQ_TAIL])
+            if sent < len(payload) + len(_REQ_TAIL):
+                # Short write (large plan imports): finish with the remainder
+                remaining = memoryview(payload + _REQ_TAIL)[sent:]
+                while remaining:
+                    remaining = remaining[os.write(fd, remaining) :]
+
+            response = bytearray()
+            while chunk := os.read(fd, _RECV_SIZE):
+                response += chunk
+                if b"\n" in chunk:
+                    break
+        except BlockingIOError as err:
+            # SO_RCVTIMEO/SO_SNDTIMEO expiry surfaces as EAGAIN on a blocking fd
+            raise TimeoutError(f"daemon did not respond within {self._timeout}s") from err
 
-        raise RuntimeError(
-            f"Daemon failed to start (timeout {timeout_seconds}s waiting for socket)"
-        )
-    finally:
-        for path in [stderr_path, status_path]:
-            with contextlib.suppress(OSError):
-                Path(path).unlink(missing_ok=True)
+        result: dict[str, Any] = json.loads(response)
+        return result
 
 
-def send_rpc(
+def _connect(
     socket_path: str,
-    request: dict[str, Any],
     worktree_root: str | None = None,
     timeout: float = 5.0,
     max_retries: int = 1,
-) -> dict[str, Any]:
+) -> _Connection:
     for attempt in range(max_retries + 1):
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-
         try:
-            sock.connect(socket_path)
-            sock.sendall(json.dumps(request).encode() + b"\n")
+            return _Connection(socket_path, timeout)
+        except OSError:
+            if attempt < max_retries and worktree_root:
+                spawn_daemon(worktree_root, socket_path)
+                continue
+            raise
 
-            response = b""
-            while True:
-                chunk = sock.recv(4096)
-                if not chunk:
-                    break
-                response += chunk
-                if b"\n" in response:
-                    break
+    raise RuntimeError("connect failed after all retries")
 
-            result: dict[str, Any] = json.loads(response.decode().strip())
-            return result
 
+def send_rpc(
+    socket_path: str,
+    request: dict[str, Any],
+    worktree_root: str | None = None,
+    timeout: float = 5.0,
+    max_retries: int = 1,
+) -> dict[str, Any]:
+    for attempt in range(max_retries + 1):
+        try:
+            with _Connection(socket_path, timeout) as conn:
+                return conn.call(request)
         except (FileNotFoundError, ConnectionRefusedError, BrokenPipeError, OSError):
             if attempt < max_retries and worktree_root:
                 spawn_daemon(worktree_root, socket_path)
                 continue
             raise
-        finally:
-            sock.close()
 
     raise RuntimeError("send_rpc failed after all retries")
 
 
 def _get_git_root() -> str:
+    # Only a bare GIT_DIR needs git itself to find the toplevel
+    work_tree = os.getenv("GIT_WORK_TREE")
+    if work_tree:
+        return str(Path(work_tree).resolve())
+
+    cwd = Path.cwd()
+    if not os.getenv("GIT_DIR"):
+        for candidate in (cwd, *cwd.parents):
+            if (candidate / ".git").exists():
+                return str(candidate)
+        # git would search the same parents and fail: not inside a repository
+        return str(cwd)
+
+    import subprocess
+
     result = subprocess.run(
         ["git", "rev-parse", "--show-toplevel"],
         capture_output=True,
@@ -209,7 +290,7 @@ def _get_git_root() -> str:
     )
     if result.returncode == 0:
         return result.stdout.strip()
-    return str(Path.cwd())
+    return str(cwd)
 
 
 def _format_duration(seconds: float) -> str:
@@ -225,6 +306,8 @@ def _format_duration(seconds: float) -> str:
 
 
 def _format_relative_time(iso_timestamp: str) -> str:
+    from datetime import UTC, datetime
+
     dt = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
     now = datetime.now(UTC)
     delta = (now - dt).total_seconds()
@@ -265,17 +348,41 @@ def _cmd_status_all() -> int:
     return 0
 
 
-def _cmd_status(args: argparse.Namespace, socket_path: str, worktree_root: str) -> None:
+class _StatusArgs(Protocol):
+    # Satisfied by both argparse.Namespace and the bare-command SimpleNamespace
+    @property
+    def json(self) -> bool: ...
+
+    @property
+    def watch(self) -> int | None: ...
+
+
+def _cmd_status(args: _StatusArgs, socket_path: str, worktree_root: str) -> None:
+    from datetime import UTC, datetime
+
     if getattr(args, "all", False):
         _cmd_status_all()
         return
 
     json_output = args.json
     watch_interval = args.watch
+    conn: _Connection | None = None
+
+    def fetch_status() -> dict[str, Any]:
+        # --watch reuses one connection, reconnecting if the daemon went away
+        nonlocal conn
+        if conn is not None:
+            try:
+                return conn.call({"command": "status"})
+            except (OSError, ValueError):
+                conn.close()
+                conn = None
+        conn = _connect(socket_path, worktree_root)
+        return conn.call({"command": "status"})
 
     def render_once() -> bool:
         try:
-            response = send_rpc(socket_path, {"command": "status"}, worktree_root)
+            response = fetch_status()
         except FileNotFoundError:
             if json_output:
                 print(json.dumps({"daemon": False, "active": False}))
@@ -423,22 +530,51 @@ def _cmd_status(args: argparse.Namespace, socket_path: str, worktree_root: str)
         print()
         return True
 
-    if watch_interval is not None:
-        try:
-            while True:
-                print("\033[2J\033[H", end="")
-                active = render_once()
-                if not active:
-                    break
-                time.sleep(watch_interval)
-        except KeyboardInterrupt:
-            print("\nStopped watching.")
-    else:
-        render_once()
-    return
+    try:
+        if watch_interval is not None:
+            try:
+                while True:
+                    print("\033[2J\033[H", end="")
+                    active = render_once()
+                    if not active:
+                        break
+                    time.sleep(watch_interval)
+            except KeyboardInterrupt:
+                print("\nStopped watching.")
+        else:
+            render_once()
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+# Argument-less commands main() dispatches without building the argparse tree
+_BARE_COMMANDS: Final[frozenset[str]] = frozenset(
+    {
+        "ping",
+        "get-state",
+        "session-start",
+        "check-state",
+        "check-commit",
+        "context-preserve",
+        "shutdown",
+        "worker-id",
+    }
+)
 
 
-def main() -> None:
+def _parse_bare_command(argv: list[str]) -> SimpleNamespace | None:
+    project = None
+    if len(argv) == 3 and argv[0] == "--project":
+        project, argv = argv[1], argv[2:]
+    if len(argv) == 1 and argv[0] in _BARE_COMMANDS:
+        return SimpleNamespace(command=argv[0], project=project)
+    return None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="hyh", description="Thread-safe state management for dev-workflow"
     )
@@ -568,7 +704,16 @@ def main() -> None:
     workflow_status.add_argument("--json", action="store_true", help="Output JSON")
     workflow_status.add_argument("--quiet", action="store_true", help="Minimal output")
 
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    args = _parse_bare_command(argv) or _build_parser().parse_args(argv)
+
+    if args.command == "worker-id":
+        _cmd_worker_id()
+        return
 
     if args.project:
         worktree_root = str(Path(args.project).resolve())
@@ -622,11 +767,11 @@ def main() -> None:
             _cmd_check_commit(socket_path, worktree_root)
         case "shutdown":
             _cmd_shutdown(socket_path, worktree_root)
-        case "worker-id":
-            _cmd_worker_id()
         case "context-preserve":
             _cmd_context_preserve(socket_path, worktree_root)
         case "demo":
+            from hyh import demo
+
             demo.run()
         case "init":
             _cmd_init()
@@ -674,7 +819,7 @@ def _cmd_get_state(socket_path: str, worktree_root: str) -> None:
 
 
 def _cmd_update_state(socket_path: str, worktree_root: str, fields: list[list[str]]) -> None:
-    updates = {key: value for key, value in fields}
+    updates = dict(fields)
 
     response = send_rpc(
         socket_path,
@@ -698,32 +843,46 @@ def _cmd_git(socket_path: str, worktree_root: str, git_args: list[str]) -> None:
         print(f"Error: {response.get('message')}", file=sys.stderr)
         sys.exit(1)
     data = response["data"]
-    print(data["stdout"], end="")
+    sys.stdout.write(data["stdout"])
     if data["stderr"]:
-        print(data["stderr"], file=sys.stderr, end="")
+        sys.stderr.write(data["stderr"])
     sys.exit(data["returncode"])
 
 
+def _is_unknown_request(response: dict[str, Any]) -> bool:
+    # Daemons outlive client upgrades: an older one rejects newer commands
+    return response["status"] == "error" and response.get("message", "").startswith(
+        "Invalid request"
+    )
+
+
+def _task_progress(socket_path: str, worktree_root: str) -> tuple[int, int]:
+    with _connect(socket_path, worktree_root) as conn:
+        response = conn.call({"command": "task_progress"})
+        if not _is_unknown_request(response):
+            if response["status"] != "ok":
+                return 0, 0
+            return response["data"]["total"], response["data"]["completed"]
+
+        response = conn.call({"command": "get_state"})
+    if response["status"] != "ok" or response["data"]["state"] is None:
+        return 0, 0
+    tasks = response["data"]["state"].get("tasks", {})
+    completed = sum(1 for t in tasks.values() if t.get("status") == "completed")
+    return len(tasks), completed
+
+
 def _cmd_session_start(socket_path: str, worktree_root: str) -> None:
     try:
-        response = send_rpc(socket_path, {"command": "get_state"}, worktree_root)
+        total_tasks, completed_tasks = _task_progress(socket_path, worktree_root)
     except (FileNotFoundError, ConnectionRefusedError):
         print("{}")
         return
 
-    if response["status"] != "ok" or response["data"]["state"] is None:
+    if not total_tasks:
         print("{}")
         return
 
-    state = response["data"]["state"]
-    tasks = state.get("tasks", {})
-    if not tasks:
-        print("{}")
-        return
-
-    total_tasks = len(tasks)
-    completed_tasks = sum(1 for t in tasks.values() if t.get("status") == "completed")
-
     output = {
         "hookSpecificOutput": {
             "hookEventName": "SessionStart",
@@ -735,24 +894,15 @@ def _cmd_session_start(socket_path: str, worktree_root: str) -> None:
 
 def _cmd_check_state(socket_path: str, worktree_root: str) -> None:
     try:
-        response = send_rpc(socket_path, {"command": "get_state"}, worktree_root)
+        total_tasks, completed_tasks = _task_progress(socket_path, worktree_root)
     except (FileNotFoundError, ConnectionRefusedError):
         print("allow")
         return
 
-    if response["status"] != "ok" or response["data"]["state"] is None:
-        print("allow")
-        return
-
-    state = response["data"]["state"]
-    tasks = state.get("tasks", {})
-    if not tasks:
+    if not total_tasks:
         print("allow")
         return
 
-    total_tasks = len(tasks)
-    completed_tasks = sum(1 for t in tasks.values() if t.get("status") == "completed")
-
     if completed_tasks < total_tasks:
         print(f"deny: Workflow in progress ({completed_tasks}/{total_tasks})")
         sys.exit(1)
@@ -760,23 +910,32 @@ def _cmd_check_state(socket_path: str, worktree_root: str) -> None:
 
 
 def _cmd_check_commit(socket_path: str, worktree_root: str) -> None:
+    calls = [
+        {"command": "get_state"},
+        {"command": "git", "args": ["rev-parse", "HEAD"], "cwd": str(Path.cwd())},
+    ]
     try:
-        response = send_rpc(socket_path, {"command": "get_state"}, worktree_root)
+        with _connect(socket_path, worktree_root) as conn:
+            response = conn.call({"command": "batch", "calls": calls})
+            if _is_unknown_request(response):
+                results = [conn.call(call) for call in calls]
+            elif response["status"] == "ok":
+                results = response["data"]["results"]
+            else:
+                results = None
     except (FileNotFoundError, ConnectionRefusedError):
         print("allow")
         return
-
-    if response["status"] != "ok" or response["data"]["state"] is None:
+    if results is None:
         print("allow")
         return
 
-    state = response["data"]["state"]
+    state_response, git_response = results
+    if state_response["status"] != "ok" or state_response["data"]["state"] is None:
+        print("allow")
+        return
+    state = state_response["data"]["state"]
 
-    git_response = send_rpc(
-        socket_path,
-        {"command": "git", "args": ["rev-parse", "HEAD"], "cwd": str(Path.cwd())},
-        worktree_root,
-    )
     if git_response["status"] != "ok":
         print("allow")
         return
@@ -804,7 +963,7 @@ def _cmd_shutdown(socket_path: str, _worktree_root: str) -> None:
 def _cmd_task_claim(socket_path: str, worktree_root: str) -> None:
     response = send_rpc(
         socket_path,
-        {"command": "task_claim", "worker_id": WORKER_ID},
+        {"command": "task_claim", "worker_id": _worker_id()},
         worktree_root,
     )
     if response["status"] != "ok":
@@ -821,7 +980,7 @@ def _cmd_task_complete(
         {
             "command": "task_complete",
             "task_id": task_id,
-            "worker_id": WORKER_ID,
+            "worker_id": _worker_id(),
             "force": force,
         },
         worktree_root,
@@ -867,14 +1026,14 @@ def _cmd_exec(
         print(f"Error: {response.get('message')}", file=sys.stderr)
         sys.exit(1)
     data = response["data"]
-    print(data["stdout"], end="")
+    sys.stdout.write(data["stdout"])
     if data["stderr"]:
-        print(data["stderr"], file=sys.stderr, end="")
+        sys.stderr.write(data["stderr"])
     sys.exit(data["returncode"])
 
 
 def _cmd_worker_id() -> None:
-    print(get_worker_id())
+    print(_worker_id())
 
 
 def _cmd_context_preserve(socket_path: str, worktree_root: str) -> None:
@@ -16,14 +16,20 @@ import msgspec
 from msgspec import Meta, Struct, field
 
 from .acp import ACPEmitter
-from .git import safe_git_exec
+from .git import read_head_sha, safe_git_exec
 from .plan import parse_plan_content
 from .registry import ProjectRegistry
 from .runtime import Runtime, create_runtime, decode_signal
-from .state import WorkflowStateStore
+from .state import Task, TaskStatus, WorkflowState, WorkflowStateStore
 from .trajectory import TrajectoryLogger
 
 TRUNCATE_LIMIT: Final[int] = 4096
+# exec keeps the tail of each stream: what fails a build or test run is at the end
+EXEC_OUTPUT_LIMIT: Final[int] = 8 * 1024 * 1024
+# Ready-pipe protocol with spawn_daemon: a lone newline once listening, else an
+# error message short enough (POSIX PIPE_BUF minimum) to arrive in one write.
+_READY: Final[bytes] = b"\n"
+_STARTUP_ERROR_MAX: Final[int] = 512
 
 
 # -- Request Types (Tagged Union) --
@@ -41,6 +47,14 @@ class StatusRequest(
     event_count: int = 10
 
 
+class TaskProgressRequest(
+    Struct, forbid_unknown_fields=True, frozen=True, tag="task_progress", tag_field="command"
+):
+    """Request task counts only, for hooks that do not need the full state."""
+
+    pass
+
+
 class UpdateStateRequest(
     Struct, forbid_unknown_fields=True, frozen=True, tag="update_state", tag_field="command"
 ):
@@ -118,9 +132,18 @@ class ContextPreserveRequest(
     pass
 
 
+class BatchRequest(
+    Struct, forbid_unknown_fields=True, frozen=True, tag="batch", tag_field="command"
+):
+    """Run several requests in order over a single round-trip."""
+
+    calls: list[msgspec.Raw]
+
+
 type Request = (
     GetStateRequest
     | StatusRequest
+    | TaskProgressRequest
     | UpdateStateRequest
     | GitRequest
     | PingRequest
@@ -131,6 +154,7 @@ type Request = (
     | PlanImportRequest
     | PlanResetRequest
     | ContextPreserveRequest
+    | BatchRequest
 )
 
 
@@ -158,7 +182,15 @@ type Result = Ok | Err
 class GetStateData(Struct, forbid_unknown_fields=True, frozen=True):
     """Response data for get_state."""
 
-    state: dict[str, object] | None
+    # Pre-encoded WorkflowState, so unchanged state is not re-serialized per poll
+    state: msgspec.Raw | None
+
+
+class TaskProgressData(Struct, forbid_unknown_fields=True, frozen=True):
+    """Response data for task_progress."""
+
+    total: int
+    completed: int
 
 
 class GitData(Struct, forbid_unknown_fields=True, frozen=True):
@@ -203,7 +235,7 @@ class StatusData(Struct, forbid_unknown_fields=True, frozen=True):
 
     active: bool
     summary: StatusSummary
-    tasks: dict[str, object]
+    tasks: dict[str, Task]
     events: list[dict[str, object]]
     active_workers: list[str]
 
@@ -211,13 +243,13 @@ class StatusData(Struct, forbid_unknown_fields=True, frozen=True):
 class UpdateStateData(Struct, forbid_unknown_fields=True, frozen=True):
     """Response data for update_state."""
 
-    state: dict[str, object]
+    state: WorkflowState
 
 
 class TaskClaimData(Struct, forbid_unknown_fields=True, frozen=True):
     """Response data for task_claim."""
 
-    task: dict[str, object] | None
+    task: Task | None
     is_retry: bool = False
     is_reclaim: bool = False
 
@@ -253,20 +285,78 @@ class ContextPreserveData(Struct, forbid_unknown_fields=True, frozen=True):
     message: str | None = None
 
 
+class BatchData(Struct, forbid_unknown_fields=True, frozen=True):
+    """Response data for batch, one Result per call in request order."""
+
+    results: list[Result]
+
+
+# Fixed replies are built once; the structs are frozen, so sharing them is safe
+_SHUTDOWN_OK: Final[Result] = Ok(data=ShutdownData(shutdown=True))
+_PLAN_RESET_OK: Final[Result] = Ok(data=PlanResetData(message="Workflow state cleared"))
+_INACTIVE_STATUS: Final[Result] = Ok(
+    data=StatusData(
+        active=False,
+        summary=StatusSummary(total=0, completed=0, running=0, pending=0, failed=0),
+        tasks={},
+        events=[],
+        active_workers=[],
+    )
+)
+
+# The client's exact ping bytes, answered from a pre-encoded reply without decoding
+_PING_LINE: Final[bytes] = b'{"command":"ping"}\n'
+
+# Built once: decode(raw, type=Request) re-resolves the union's tag table per call
+_decoder: Final = msgspec.json.Decoder(Request)
+_encoder: Final = msgspec.json.Encoder()
+
+
+def _timeout_output(output: bytes | str | None) -> str:
+    # The capped runtime path hands over decoded text; plain subprocess.run
+    # timeouts still carry bytes.
+    if isinstance(output, bytes):
+        return output.decode(errors="replace")
+    return output or ""
+
+
 class HarnessHandler(socketserver.StreamRequestHandler):
+    # Large plan imports arrive in 64 KiB reads instead of io's 8 KiB default.
+    # wbufsize stays 0: each response is already a single sendall of one buffer.
+    rbufsize = 65536
+
     server: HarnessDaemon
 
     def handle(self) -> None:
-        try:
-            line = self.rfile.readline()
-            if not line:
-                return
-
-            response_bytes = self.dispatch(line.strip())
-            self.wfile.write(response_bytes + b"\n")
-        except Exception as e:
-            error_response = msgspec.json.encode(Err(message=str(e)))
-            self.wfile.write(error_response + b"\n")
+        # Serve newline-delimited requests until the client closes, so callers
+        # issuing several RPCs can reuse one connection.
+        # One output buffer per connection: each response is encoded into it in
+        # place and newline-terminated without copying into a fresh bytes object.
+        buf = bytearray()
+        ping_reply = self.server.ping_reply
+        shutdown_requested = self.server.shutdown_requested
+        while line := self.rfile.readline():
+            if line == _PING_LINE:
+                reply: bytes | bytearray = ping_reply
+            else:
+                try:
+                    # No strip(): JSON allows the trailing newline, and stripping
+                    # would copy the whole line (megabytes for a plan import).
+                    _encoder.encode_into(self._execute(line), buf)
+                except Exception as e:
+                    _encoder.encode_into(Err(message=str(e)), buf)
+                buf += b"\n"
+                reply = buf
+            try:
+                self.wfile.write(reply)
+            except OSError:
+                break
+            if shutdown_requested.is_set():
+                break
+        # Stop the server only once the shutdown reply is on the socket, so the
+        # process cannot exit before the client has its answer.
+        if shutdown_requested.is_set():
+            self.server.shutdown()
 
     def dispatch(self, raw: bytes) -> bytes:
         """Dispatch typed request to handler methods.
@@ -277,10 +367,18 @@ class HarnessHandler(socketserver.StreamRequestHandler):
         Returns:
             JSON-encoded Result (Ok or Err)
         """
+        return _encoder.encode(self._execute(raw))
+
+    def _execute(self, raw: bytes | msgspec.Raw, *, in_batch: bool = False) -> Result:
         try:
-            request = msgspec.json.decode(raw, type=Request)
+            request = _decoder.decode(raw)
         except (msgspec.ValidationError, msgspec.DecodeError) as e:
-            return msgspec.json.encode(Err(message=f"Invalid request: {e}"))
+            return Err(message=f"Invalid request: {e}")
+
+        # Nested batches would recurse without bound, and a shutdown would stop
+        # the server while the rest of the batch still runs.
+        if in_batch and isinstance(request, BatchRequest | ShutdownRequest):
+            return Err(message="batch and shutdown are not allowed inside a batch")
 
         server = self.server
 
@@ -290,6 +388,8 @@ class HarnessHandler(socketserver.StreamRequestHandler):
                 result = self._handle_get_state(request, server)
             case StatusRequest():
                 result = self._handle_status(request, server)
+            case TaskProgressRequest():
+                result = self._handle_task_progress(request, server)
             case UpdateStateRequest():
                 result = self._handle_update_state(request, server)
             case GitRequest():
@@ -310,43 +410,40 @@ class HarnessHandler(socketserver.StreamRequestHandler):
                 result = self._handle_plan_reset(request, server)
             case ContextPreserveRequest():
                 result = self._handle_context_preserve(request, server)
+            case BatchRequest():
+                result = self._handle_batch(request, server)
 
-        return msgspec.json.encode(result)
+        return result
+
+    def _handle_batch(self, request: BatchRequest, _server: HarnessDaemon) -> Result:
+        # Each call is decoded on its own so one invalid entry fails alone
+        results = [self._execute(call, in_batch=True) for call in request.calls]
+        return Ok(data=BatchData(results=results))
 
     def _handle_get_state(self, _request: GetStateRequest, server: HarnessDaemon) -> Result:
         state = server.state_manager.load()
         if state is None:
             return Ok(data=GetStateData(state=None))
-        return Ok(data=GetStateData(state=msgspec.to_builtins(state)))
-
-    def _handle_status(self, request: StatusRequest, server: HarnessDaemon) -> Result:
-        from .state import TaskStatus
-
-        state = server.state_manager.load()
-
-        if state is None:
-            return Ok(
-                data=StatusData(
-                    active=False,
-                    summary=StatusSummary(
-                        total=0,
-                        completed=0,
-                        running=0,
-                        pending=0,
-                        failed=0,
-                    ),
-                    tasks={},
-                    events=[],
-                    active_workers=[],
-                )
-            )
-
-        tasks = state.tasks
+        cached = server.state_reply_cache
+        if cached is not None and cached[0] is state:
+            return cached[1]
+        reply = Ok(data=GetStateData(state=msgspec.Raw(_encoder.encode(state))))
+        server.state_reply_cache = (state, reply)
+        return reply
+
+    def _summarize(
+        self, state: WorkflowState, server: HarnessDaemon
+    ) -> tuple[StatusSummary, list[str]]:
+        # load() returns the same snapshot object until the state changes, so
+        # repeated status/task_progress polls reuse one pass over the tasks.
+        cached = server.summary_cache
+        if cached is not None and cached[0] is state:
+            return cached[1], cached[2]
 
         completed = running = pending = failed = 0
         active_workers: set[str] = set()
 
-        for task in tasks.values():
+        for task in state.tasks.values():
             match task.status:
                 case TaskStatus.COMPLETED:
                     completed += 1
@@ -360,22 +457,39 @@ class HarnessHandler(socketserver.StreamRequestHandler):
                     failed += 1
 
         summary = StatusSummary(
-            total=len(tasks),
+            total=len(state.tasks),
             completed=completed,
             running=running,
             pending=pending,
             failed=failed,
         )
+        workers = list(active_workers)
+        server.summary_cache = (state, summary, workers)
+        return summary, workers
+
+    def _handle_task_progress(self, _request: TaskProgressRequest, server: HarnessDaemon) -> Result:
+        state = server.state_manager.load()
+        if state is None:
+            return Ok(data=TaskProgressData(total=0, completed=0))
+        summary, _ = self._summarize(state, server)
+        return Ok(data=TaskProgressData(total=summary.total, completed=summary.completed))
+
+    def _handle_status(self, request: StatusRequest, server: HarnessDaemon) -> Result:
+        state = server.state_manager.load()
 
+        if state is None:
+            return _INACTIVE_STATUS
+
+        summary, active_workers = self._summarize(state, server)
         events = server.trajectory_logger.tail(n=request.event_count)
 
         return Ok(
             data=StatusData(
                 active=True,
                 summary=summary,
-                tasks={tid: msgspec.to_builtins(t) for tid, t in tasks.items()},
+                tasks=state.tasks,
                 events=events,
-                active_workers=list(active_workers),
+                active_workers=active_workers,
             )
         )
 
@@ -385,13 +499,16 @@ class HarnessHandler(socketserver.StreamRequestHandler):
             return Err(message="No updates provided")
         try:
             updated = server.state_manager.update(**updates)
-            return Ok(data=UpdateStateData(state=msgspec.to_builtins(updated)))
+            return Ok(data=UpdateStateData(state=updated))
         except Exception as e:
             return Err(message=str(e))
 
     def _handle_git(self, request: GitRequest, server: HarnessDaemon) -> Result:
         args = request.args
         cwd = request.cwd if request.cwd else str(server.worktree_root)
+        # check-commit asks for HEAD on every Stop hook; answer it from the ref files
+        if args == ["rev-parse", "HEAD"] and (sha := read_head_sha(cwd)) is not None:
+            return Ok(data=GitData(returncode=0, stdout=f"{sha}\n", stderr=""))
         result = safe_git_exec(args, cwd)
         return Ok(
             data=GitData(
@@ -401,12 +518,12 @@ class HarnessHandler(socketserver.StreamRequestHandler):
             )
         )
 
-    def _handle_ping(self, _request: PingRequest, _server: HarnessDaemon) -> Result:
-        return Ok(data=PingData(running=True, pid=os.getpid()))
+    def _handle_ping(self, _request: PingRequest, server: HarnessDaemon) -> Result:
+        return server.ping_result
 
     def _handle_shutdown(self, _request: ShutdownRequest, server: HarnessDaemon) -> Result:
-        threading.Thread(target=server.shutdown, daemon=True).start()
-        return Ok(data=ShutdownData(shutdown=True))
+        server.shutdown_requested.set()
+        return _SHUTDOWN_OK
 
     def _handle_task_claim(self, request: TaskClaimRequest, server: HarnessDaemon) -> Result:
         worker_id = request.worker_id
@@ -441,7 +558,7 @@ class HarnessHandler(socketserver.StreamRequestHandler):
 
             return Ok(
                 data=TaskClaimData(
-                    task=msgspec.to_builtins(task),
+                    task=task,
                     is_retry=claim_result.is_retry,
                     is_reclaim=claim_result.is_reclaim,
                 )
@@ -492,15 +609,16 @@ class HarnessHandler(socketserver.StreamRequestHandler):
             return Err(message="args is required")
 
         try:
-            start_time = time.monotonic()
+            start_ns = time.monotonic_ns()
             result = server.runtime.execute(
                 command=args,
                 cwd=cwd,
                 env=env,
                 timeout=timeout,
                 exclusive=exclusive,
+                output_limit=EXEC_OUTPUT_LIMIT,
             )
-            duration_ms = int((time.monotonic() - start_time) * 1000)
+            duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
             signal_name = decode_signal(result.returncode) if result.returncode < 0 else None
 
@@ -525,7 +643,7 @@ class HarnessHandler(socketserver.StreamRequestHandler):
                 )
             )
         except subprocess.TimeoutExpired as e:
-            duration_ms = int((time.monotonic() - start_time) * 1000)
+            duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             signal_name = "SIGTERM"
             server.trajectory_logger.log(
                 {
@@ -540,8 +658,8 @@ class HarnessHandler(socketserver.StreamRequestHandler):
             return Ok(
                 data=ExecData(
                     returncode=-15,
-                    stdout=e.stdout.decode() if e.stdout else "",
-                    stderr=e.stderr.decode() if e.stderr else "",
+                    stdout=_timeout_output(e.stdout),
+                    stderr=_timeout_output(e.stderr),
                     signal_name=signal_name,
                 )
             )
@@ -556,7 +674,7 @@ class HarnessHandler(socketserver.StreamRequestHandler):
         try:
             plan = parse_plan_content(content)
             state = plan.to_workflow_state()
-            server.state_manager.save(state)
+            server.state_manager.save(state, validated=True)
 
             server.trajectory_logger.log(
                 {
@@ -588,14 +706,12 @@ class HarnessHandler(socketserver.StreamRequestHandler):
         if server.acp_emitter:
             server.acp_emitter.emit({"event_type": "plan_reset"})
 
-        return Ok(data=PlanResetData(message="Workflow state cleared"))
+        return _PLAN_RESET_OK
 
     def _handle_context_preserve(
         self, _request: ContextPreserveRequest, server: HarnessDaemon
     ) -> Ok | Err:
         """Write current workflow state to .claude/progress.txt for PreCompact."""
-        from .state import TaskStatus
-
         state = server.state_manager.load()
         if state is None:
             return Ok(data=ContextPreserveData(message="No active workflow"))
@@ -641,6 +757,11 @@ class HarnessDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
     trajectory_logger: TrajectoryLogger
     acp_emitter: ACPEmitter | None
     runtime: Runtime
+    ping_result: Result
+    ping_reply: bytes
+    shutdown_requested: threading.Event
+    summary_cache: tuple[WorkflowState, StatusSummary, list[str]] | None
+    state_reply_cache: tuple[WorkflowState, Result] | None
     _lock_fd: TextIOWrapper | None
     _lock_path: str
 
@@ -658,6 +779,12 @@ class HarnessDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
             self.worktree_root / ".claude" / "trajectory.jsonl"
         )
         self.acp_emitter = acp_emitter
+        # Liveness probes are the most frequent RPC and their reply never changes
+        self.ping_result = Ok(data=PingData(running=True, pid=os.getpid()))
+        self.ping_reply = _encoder.encode(self.ping_result) + b"\n"
+        self.shutdown_requested = threading.Event()
+        self.summary_cache = None
+        self.state_reply_cache = None
 
         registry = ProjectRegistry()
         registry.register(self.worktree_root)
@@ -667,8 +794,8 @@ class HarnessDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
 
         self._acquire_lock()
 
-        if Path(socket_path).exists():
-            Path(socket_path).unlink()
+        socket_file = Path(socket_path)
+        socket_file.unlink(missing_ok=True)
 
         old_umask = os.umask(0o077)
         try:
@@ -676,7 +803,7 @@ class HarnessDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
         finally:
             os.umask(old_umask)
 
-        Path(socket_path).chmod(0o600)
+        socket_file.chmod(0o600)
 
         self.state_manager.load()
 
@@ -692,22 +819,33 @@ class HarnessDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
 
     def server_close(self) -> None:
         super().server_close()
+        self.trajectory_logger.close()
         if self.acp_emitter:
             self.acp_emitter.close()
-        socket_path = Path(self.socket_path)
-        if socket_path.exists():
-            socket_path.unlink()
+        Path(self.socket_path).unlink(missing_ok=True)
         if self._lock_fd:
             fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
             self._lock_fd.close()
 
-            lock_path = Path(self._lock_path)
             with contextlib.suppress(OSError):
-                lock_path.unlink(missing_ok=True)
+                Path(self._lock_path).unlink(missing_ok=True)
+
 
+def _report_startup(ready_fd: int, message: bytes) -> None:
+    # Closing the fd keeps it out of anything the daemon later runs
+    with contextlib.suppress(OSError):
+        os.write(ready_fd, message)
+    os.close(ready_fd)
 
-def run_daemon(socket_path: str, worktree_root: str) -> None:
-    daemon = HarnessDaemon(socket_path, worktree_root)
+
+def run_daemon(socket_path: str, worktree_root: str, ready_fd: int | None = None) -> None:
+    try:
+        daemon = HarnessDaemon(socket_path, worktree_root)
+    except Exception as e:
+        # The spawning client reads the reason straight off the ready pipe
+        if ready_fd is not None:
+            _report_startup(ready_fd, f"{type(e).__name__}: {e}".encode()[:_STARTUP_ERROR_MAX])
+        raise
 
     def handle_sigterm(_signum: int, _frame: FrameType | None) -> None:
         threading.Thread(target=daemon.shutdown, daemon=True).start()
@@ -715,6 +853,14 @@ def run_daemon(socket_path: str, worktree_root: str) -> None:
     signal_module.signal(signal_module.SIGTERM, handle_sigterm)
     signal_module.signal(signal_module.SIGINT, handle_sigterm)
 
+    if ready_fd is not None:
+        # The client stops reading our stderr once ready: send the rest nowhere
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stderr.fileno())
+        os.close(devnull)
+        # The socket is listening: wake the spawning client instead of making it poll
+        _report_startup(ready_fd, _READY)
+
     try:
         daemon.serve_forever()
     finally:
@@ -724,6 +870,11 @@ def run_daemon(socket_path: str, worktree_root: str) -> None:
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
-        print("Usage: python -m hyh.daemon <socket_path> <worktree_root>")
+        print("Usage: python -m hyh.daemon <socket_path> <worktree_root>", file=sys.stderr)
         sys.exit(1)
-    run_daemon(sys.argv[1], sys.argv[2])
+    ready_fd = os.environ.pop("HYH_READY_FD", None)
+    if ready_fd and os.fork():
+        # Spawned by a client: leave the daemon to init so the client has no
+        # long-lived child to reap. The ready pipe and stderr go with the fork.
+        os._exit(0)
+    run_daemon(sys.argv[1], sys.argv[2], int(ready_fd) if ready_fd else None)
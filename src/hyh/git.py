@@ -1,3 +1,5 @@
+import os
+from pathlib import Path
 from typing import Final
 
 from .runtime import ExecutionResult, LocalRuntime
@@ -24,6 +26,73 @@ _DANGEROUS_PREFIXES: Final[tuple[str, ...]] = (
 )
 
 
+_SHA_HEX_LENGTHS: Final[frozenset[int]] = frozenset({40, 64})
+_HEX_DIGITS: Final[frozenset[str]] = frozenset("0123456789abcdef")
+
+
+def _is_sha(value: str) -> bool:
+    return len(value) in _SHA_HEX_LENGTHS and _HEX_DIGITS.issuperset(value)
+
+
+def _find_git_dir(cwd: str) -> Path | None:
+    path = Path(cwd).resolve()
+    for candidate in (path, *path.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            # Linked worktrees and submodules point at their git dir from a .git file
+            content = dot_git.read_text(encoding="utf-8").strip()
+            if not content.startswith("gitdir: "):
+                return None
+            return (candidate / content.removeprefix("gitdir: ")).resolve()
+    return None
+
+
+def _resolve_ref(git_dir: Path, ref: str) -> str | None:
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        common_dir = (git_dir / commondir_file.read_text(encoding="utf-8").strip()).resolve()
+
+    for base in (git_dir, common_dir):
+        try:
+            sha = (base / ref).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            continue
+        return sha if _is_sha(sha) else None
+
+    try:
+        with (common_dir / "packed-refs").open(encoding="utf-8") as f:
+            for line in f:
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref and _is_sha(sha):
+                    return sha
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def read_head_sha(cwd: str) -> str | None:
+    """Resolve HEAD from the git dir without spawning git.
+
+    Returns None for anything unusual (GIT_DIR overrides, unborn branches,
+    nested symbolic refs) so callers can fall back to ``git rev-parse HEAD``.
+    """
+    if os.getenv("GIT_DIR"):
+        return None
+    try:
+        git_dir = _find_git_dir(cwd)
+        if git_dir is None:
+            return None
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: "):
+            return head if _is_sha(head) else None
+        return _resolve_ref(git_dir, head.removeprefix("ref: "))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
 def _validate_git_args(args: list[str]) -> None:
     for arg in args:
         if arg in _DANGEROUS_OPTIONS:
@@ -76,6 +145,8 @@ def safe_commit(cwd: str, message: str) -> ExecutionResult:
 
 
 def get_head_sha(cwd: str) -> str | None:
+    if (sha := read_head_sha(cwd)) is not None:
+        return sha
     result = safe_git_exec(["rev-parse", "HEAD"], cwd=cwd, read_only=True)
     if result.returncode == 0:
         return result.stdout.strip()
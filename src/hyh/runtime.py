@@ -1,7 +1,9 @@
 import os
+import selectors
 import signal
 import subprocess
 import threading
+import time
 from abc import ABC, abstractmethod
 from typing import Final, Protocol
 
@@ -9,18 +11,16 @@ from msgspec import Struct
 
 GLOBAL_EXEC_LOCK: Final[threading.Lock] = threading.Lock()
 
+# Iterating the enum yields canonical members only, matching Signals(n).name
+_SIGNAL_NAMES: Final[dict[int, str]] = {sig.value: sig.name for sig in signal.Signals}
+
 
 def decode_signal(returncode: int) -> str | None:
     if returncode >= 0:
         return None
 
-    sig_num = abs(returncode)
-
-    try:
-        sig = signal.Signals(sig_num)
-        return sig.name
-    except ValueError:
-        return f"SIG{sig_num}"
+    sig_num = -returncode
+    return _SIGNAL_NAMES.get(sig_num) or f"SIG{sig_num}"
 
 
 class ExecutionResult(Struct, frozen=True, forbid_unknown_fields=True):
@@ -29,6 +29,74 @@ class ExecutionResult(Struct, frozen=True, forbid_unknown_fields=True):
     stderr: str
 
 
+def _decode_output(data: bytes | bytearray) -> str:
+    # Matches text=True capture: universal newlines, but a cut at the limit may
+    # split a character, so undecodable bytes are replaced instead of raising.
+    return data.decode(errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _run_capped(
+    command: list[str],
+    *,
+    cwd: str | None,
+    env: dict[str, str] | None,
+    timeout: float | None,
+    limit: int,
+) -> ExecutionResult:
+    # Drain both pipes as output arrives and keep only the last `limit` bytes
+    # of each, so a runaway build cannot grow the daemon without bound.
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with subprocess.Popen(
+        command, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    ) as proc:
+        assert proc.stdout is not None and proc.stderr is not None  # Type narrowing
+        buffers = {proc.stdout.fileno(): bytearray(), proc.stderr.fileno(): bytearray()}
+
+        def expired() -> subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            stdout, stderr = buffers.values()
+            # Decoded here, once, so callers can return the partial output as is
+            return subprocess.TimeoutExpired(
+                command,
+                timeout or 0,
+                output=_decode_output(stdout[-limit:]),
+                stderr=_decode_output(stderr[-limit:]),
+            )
+
+        with selectors.DefaultSelector() as selector:
+            for fd in buffers:
+                selector.register(fd, selectors.EVENT_READ)
+            while selector.get_map():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise expired()
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        selector.unregister(key.fd)
+                        continue
+                    buf = buffers[key.fd]
+                    buf += chunk
+                    # Trim only once the buffer doubles: amortized O(1) per byte
+                    if len(buf) > 2 * limit:
+                        del buf[:-limit]
+
+        try:
+            returncode = proc.wait(
+                timeout=None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+        except subprocess.TimeoutExpired:
+            raise expired() from None
+
+    stdout, stderr = buffers.values()
+    return ExecutionResult(
+        returncode=returncode,
+        stdout=_decode_output(stdout[-limit:]),
+        stderr=_decode_output(stderr[-limit:]),
+    )
+
+
 class PathMapper(ABC):
     __slots__ = ()
 
@@ -86,6 +154,7 @@ class Runtime(Protocol):
         env: dict[str, str] | None = None,
         timeout: float | None = None,
         exclusive: bool = False,
+        output_limit: int | None = None,
     ) -> ExecutionResult: ...
 
     def check_capabilities(self) -> None: ...
@@ -101,10 +170,16 @@ class LocalRuntime:
         env: dict[str, str] | None = None,
         timeout: float | None = None,
         exclusive: bool = False,
+        output_limit: int | None = None,
     ) -> ExecutionResult:
         def _execute() -> ExecutionResult:
             exec_env = {**os.environ, **env} if env else None
 
+            if output_limit is not None:
+                return _run_capped(
+                    command, cwd=cwd, env=exec_env, timeout=timeout, limit=output_limit
+                )
+
             result = subprocess.run(
                 command,
                 cwd=cwd,
@@ -153,6 +228,7 @@ class DockerRuntime:
         env: dict[str, str] | None = None,
         timeout: float | None = None,
         exclusive: bool = False,
+        output_limit: int | None = None,
     ) -> ExecutionResult:
         def _execute() -> ExecutionResult:
             docker_cmd = ["docker", "exec"]
@@ -172,6 +248,11 @@ class DockerRuntime:
             docker_cmd.append(self.container_id)
             docker_cmd.extend(command)
 
+            if output_limit is not None:
+                return _run_capped(
+                    docker_cmd, cwd=None, env=None, timeout=timeout, limit=output_limit
+                )
+
             result = subprocess.run(
                 docker_cmd,
                 timeout=timeout,
@@ -1,4 +1,3 @@
-import json
 import os
 import threading
 from collections.abc import Callable, Iterator, Sequence
@@ -200,14 +199,41 @@ class ClaimResult(Struct, frozen=True, forbid_unknown_fields=True):
     is_reclaim: bool = False
 
 
+# The state file is decoded straight into structs: one parse-and-validate pass
+# instead of json.loads building dicts for msgspec.convert to walk again.
+_state_decoder: Final = msgspec.json.Decoder(WorkflowState)
+
+
+type _FileKey = tuple[int, int, int]
+
+
 class WorkflowStateStore:
-    __slots__ = ("_state", "_state_lock", "state_file", "worktree_root")
+    __slots__ = ("_snapshot", "_state", "_state_lock", "state_file", "worktree_root")
 
     def __init__(self, worktree_root: Path) -> None:
         self.worktree_root: Final[Path] = Path(worktree_root)
         self.state_file: Final[Path] = self.worktree_root / ".claude" / "dev-workflow-state.json"
         self._state: WorkflowState | None = None
         self._state_lock: Final[threading.Lock] = threading.Lock()
+        # Immutable state paired with the identity of the file it matches,
+        # swapped as one reference so load() can serve it without the lock.
+        self._snapshot: tuple[_FileKey, WorkflowState] | None = None
+
+    def _file_key(self) -> _FileKey | None:
+        try:
+            st = self.state_file.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _read_state(self) -> WorkflowState:
+        # Stat before reading: if the file is replaced in between, the snapshot
+        # holds newer content under an older key and the next load re-reads.
+        key = self._file_key()
+        state = _state_decoder.decode(self.state_file.read_bytes())
+        if key is not None:
+            self._snapshot = (key, state)
+        return state
 
     def _ensure_state_loaded(self) -> WorkflowState:
         if self._state is not None:
@@ -216,36 +242,46 @@ class WorkflowStateStore:
         if not self.state_file.exists():
             raise ValueError("No workflow state: file not found and no cached state")
 
-        data = json.loads(self.state_file.read_text(encoding="utf-8"))
-        self._state = msgspec.convert(data, WorkflowState)
+        self._state = self._read_state()
         return self._state
 
     def _write_atomic(self, state: WorkflowState) -> None:
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
 
-        content = msgspec.json.encode(state).decode("utf-8")
+        content = msgspec.json.encode(state)
         temp_file = self.state_file.with_suffix(".tmp")
 
-        with temp_file.open("w", encoding="utf-8") as f:
+        with temp_file.open("wb") as f:
             f.write(content)
             f.flush()
             os.fsync(f.fileno())
 
         temp_file.rename(self.state_file)
+        key = self._file_key()
+        self._snapshot = None if key is None else (key, state)
 
     def load(self) -> WorkflowState | None:
+        # Readers (get_state, status, task_progress) skip the lock and the parse
+        # while the file on disk is still the one the snapshot was taken from.
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == self._file_key():
+            return snapshot[1]
+
         with self._state_lock:
             if not self.state_file.exists():
                 self._state = None
+                self._snapshot = None
                 return None
 
-            data = json.loads(self.state_file.read_text(encoding="utf-8"))
-            self._state = msgspec.convert(data, WorkflowState)
+            self._state = self._read_state()
             return self._state
 
-    def save(self, state: WorkflowState) -> None:
+    def save(self, state: WorkflowState, *, validated: bool = False) -> None:
+        # validated: the caller already checked the DAG (plan import does so
+        # while parsing), so the dependency and cycle walk is not repeated.
         with self._state_lock:
-            state.validate_dag()
+            if not validated:
+                state.validate_dag()
             self._write_atomic(state)
             self._state = state
 
@@ -332,3 +368,4 @@ class WorkflowStateStore:
             if self.state_file.exists():
                 self.state_file.unlink()
             self._state = None
+            self._snapshot = None
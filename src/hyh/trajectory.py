@@ -1,12 +1,25 @@
-import json
 import os
 import threading
 from pathlib import Path
 from typing import Any, Final
 
+import msgspec
+
+_encoder: Final = msgspec.json.Encoder()
+_event_decoder: Final = msgspec.json.Decoder(dict[str, Any])
+
 
 class TrajectoryLogger:
-    __slots__ = ("_parent_str", "_path_str", "_write_lock", "trajectory_file")
+    __slots__ = (
+        "_closed",
+        "_parent_str",
+        "_path_str",
+        "_sync_event",
+        "_sync_lock",
+        "_sync_thread",
+        "_write_lock",
+        "trajectory_file",
+    )
 
     def __init__(self, trajectory_file: Path) -> None:
         self.trajectory_file: Final[Path] = Path(trajectory_file)
@@ -14,19 +27,60 @@ class TrajectoryLogger:
         self._path_str: Final[str] = str(self.trajectory_file)
         self._parent_str: Final[str] = str(self.trajectory_file.parent)
         self._write_lock: Final[threading.Lock] = threading.Lock()
+        # fsync runs on a background thread: callers only pay for the append,
+        # and a burst of events shares one fsync instead of one each.
+        self._sync_event: Final[threading.Event] = threading.Event()
+        self._sync_lock: Final[threading.Lock] = threading.Lock()
+        self._sync_thread: threading.Thread | None = None
+        self._closed = False
 
     def log(self, event: dict[str, Any]) -> None:
-        line = (json.dumps(event) + "\n").encode("utf-8")
+        line = _encoder.encode(event) + b"\n"
 
         self.trajectory_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # The append itself stays synchronous, so the event is visible to
+        # readers (tail, status, hooks) as soon as log() returns.
         fd = os.open(self._path_str, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
         try:
             os.write(fd, line)
+        finally:
+            os.close(fd)
+
+        self._request_sync()
+
+    def _request_sync(self) -> None:
+        if self._sync_thread is None:
+            with self._sync_lock:
+                if self._sync_thread is None:
+                    self._sync_thread = threading.Thread(target=self._sync_loop, daemon=True)
+                    self._sync_thread.start()
+        self._sync_event.set()
+
+    def _sync_loop(self) -> None:
+        while not self._closed:
+            self._sync_event.wait()
+            # Clear before syncing: appends landing during the fsync schedule another
+            self._sync_event.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        try:
+            fd = os.open(self._path_str, os.O_WRONLY | os.O_APPEND)
+        except FileNotFoundError:
+            return
+        try:
             os.fsync(fd)
         finally:
             os.close(fd)
 
+    def close(self) -> None:
+        self._closed = True
+        self._sync_event.set()
+        if self._sync_thread is not None:
+            self._sync_thread.join()
+        self.flush()
+
     def tail(self, n: int, max_buffer_bytes: int = 1_048_576) -> list[dict[str, Any]]:
         if n <= 0:
             return []
@@ -78,9 +132,8 @@ class TrajectoryLogger:
                 if not line:
                     continue
                 try:
-                    event: dict[str, Any] = json.loads(line.decode("utf-8"))
-                    events.append(event)
-                except (json.JSONDecodeError, UnicodeDecodeError):
+                    events.append(_event_decoder.decode(line))
+                except msgspec.DecodeError:
                     continue
 
             return events[-n:] if len(events) > n else events
@@ -101,6 +101,9 @@ def test_acp_worker_send_error_disables(monkeypatch):
         def connect(self, address):
             connect_called.set()
 
+        def setsockopt(self, level, option, value):
+            pass
+
         def sendall(self, data):
             nonlocal send_count
             send_count += 1
@@ -216,3 +219,241 @@ def test_acp_disabled_flag_is_thread_safe():
 
     assert emitter._disabled_event.is_set()  # Should be disabled after connection failure
     emitter.close()
+
+
+def test_emitter_disables_nagle(monkeypatch):
+    """Worker should set TCP_NODELAY so small telemetry lines are not coalesced."""
+    sockopts: list[tuple[int, int, int]] = []
+    real_socket = socket.socket
+
+    class RecordingSocket(real_socket):
+        def setsockopt(self, level, option, value, *args):
+            sockopts.append((level, option, value))
+            return super().setsockopt(level, option, value, *args)
+
+    monkeypatch.setattr(socket, "socket", RecordingSocket)
+
+    server = real_socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    port = server.getsockname()[1]
+
+    try:
+        emitter = ACPEmitter(port=port)
+        emitter.emit({"event": "test"})
+        wait_until(
+            lambda: (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in sockopts,
+            timeout=2.0,
+            message="TCP_NODELAY should be set after connect",
+        )
+        emitter.close()
+    finally:
+        server.close()
+
+
+def test_emitter_burst_delivered_in_order(mock_server):
+    """A burst of events is drained in batches without losing or reordering lines."""
+    emitter = ACPEmitter(port=mock_server["port"])
+    for i in range(200):
+        emitter.emit({"event": "burst", "index": i})
+    emitter.emit({"event": "bad", "data": object()})  # unencodable, dropped alone
+    emitter.emit({"event": "burst", "index": 200})
+
+    def lines() -> list[str]:
+        return "".join(mock_server["received"]).splitlines()
+
+    wait_until(
+        lambda: len(lines()) >= 201,
+        timeout=2.0,
+        message="Burst not fully received by mock server",
+    )
+    emitter.close()
+
+    indexes = [json.loads(line)["index"] for line in lines()]
+    assert indexes == list(range(201))
+
+
+def test_emitter_multiple_producers_deliver_everything(mock_server):
+    """Concurrent emit() calls from handler threads must not lose events."""
+    emitter = ACPEmitter(port=mock_server["port"])
+
+    def produce(thread_id: int) -> None:
+        for i in range(50):
+            emitter.emit({"thread": thread_id, "index": i})
+
+    threads = [threading.Thread(target=produce, args=(t,)) for t in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    def received() -> list[dict]:
+        return [json.loads(line) for line in "".join(mock_server["received"]).splitlines()]
+
+    wait_until(
+        lambda: len(received()) >= 400,
+        timeout=2.0,
+        message="Not all events from concurrent producers were received",
+    )
+    emitter.close()
+
+    events = received()
+    assert len(events) == 400
+    for thread_id in range(8):
+        indexes = [e["index"] for e in events if e["thread"] == thread_id]
+        assert indexes == list(range(50))
+
+
+def test_sendmsg_all_handles_partial_writes():
+    """_sendmsg_all must resume mid-buffer when the kernel accepts a short write."""
+    from hyh.acp import _sendmsg_all
+
+    class ShortWriteSocket:
+        def __init__(self):
+            self.data = bytearray()
+
+        def sendmsg(self, buffers):
+            # Accept at most 3 bytes per call, spanning buffer boundaries
+            budget = 3
+            for buf in buffers:
+                chunk = bytes(buf[:budget])
+                self.data += chunk
+                budget -= len(chunk)
+                if budget == 0:
+                    break
+            return 3 - budget
+
+    sock = ShortWriteSocket()
+    _sendmsg_all(sock, [b'{"a":1}', b"\n", b'{"b":22}', b"\n"])
+
+    assert bytes(sock.data) == b'{"a":1}\n{"b":22}\n'
+
+
+def test_emitter_sends_datagrams_over_unix_socket(tmp_path):
+    """With path=, each entry is one AF_UNIX datagram holding one JSON object."""
+    sock_path = str(tmp_path / "acp.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    server.bind(sock_path)
+    server.settimeout(2.0)
+
+    try:
+        emitter = ACPEmitter(path=sock_path)
+        emitter.emit({"event": "first"})
+        emitter.emit({"event": "second"})
+
+        datagrams = [server.recv(4096), server.recv(4096)]
+        emitter.close()
+    finally:
+        server.close()
+
+    assert [json.loads(d)["event"] for d in datagrams] == ["first", "second"]
+    assert all(not d.endswith(b"\n") for d in datagrams)
+
+
+def test_emitter_unix_path_unavailable_disables(tmp_path, capsys):
+    """A missing datagram socket disables the emitter and names the path once."""
+    sock_path = str(tmp_path / "missing.sock")
+    emitter = ACPEmitter(path=sock_path)
+    emitter.emit({"event": "test"})
+    wait_until(
+        lambda: emitter._disabled_event.is_set(),
+        timeout=2.0,
+        message="Emitter should be disabled when the socket path does not exist",
+    )
+    emitter.close()
+
+    assert sock_path in capsys.readouterr().err
+
+
+def test_emitter_retries_connect_until_listener_is_up():
+    """A listener that starts shortly after the first emit still gets the event."""
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+
+    emitter = ACPEmitter(port=port)
+    emitter.emit({"event": "early"})
+
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(("127.0.0.1", port))
+    server.listen(1)
+    server.settimeout(2.0)
+    try:
+        conn, _ = server.accept()
+        with conn:
+            conn.settimeout(2.0)
+            line = conn.recv(4096)
+    finally:
+        server.close()
+        emitter.close()
+
+    assert json.loads(line)["event"] == "early"
+    assert not emitter._disabled_event.is_set()
+
+
+def test_emitter_close_interrupts_connect_backoff():
+    """close() must not wait out the remaining connect backoff."""
+    import time
+
+    emitter = ACPEmitter(port=59999)
+    emitter.emit({"event": "test"})
+
+    start = time.monotonic()
+    emitter.close()
+
+    assert time.monotonic() - start < 0.5
+    assert not emitter._thread.is_alive()
+
+
+def test_close_interrupts_send_to_stalled_listener():
+    """close() shuts the socket down when a send is blocked on a peer that never reads."""
+    import time
+
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    port = server.getsockname()[1]
+
+    emitter = ACPEmitter(port=port)
+    conn = None
+    try:
+        emitter.emit({"event": "first"})
+        conn, _ = server.accept()
+        # Fill the kernel buffers: the listener never calls recv()
+        burst = 2000
+        for i in range(burst):
+            emitter.emit({"event": "burst", "index": i, "pad": "x" * 4096})
+        wait_until(
+            lambda: len(emitter._buffer) < burst,
+            timeout=2.0,
+            message="Worker should start sending the burst",
+        )
+
+        start = time.monotonic()
+        emitter.close()
+        elapsed = time.monotonic() - start
+    finally:
+        if conn is not None:
+            conn.close()
+        server.close()
+
+    assert not emitter._thread.is_alive()
+    assert elapsed < 1.5
+
+
+def test_emit_drops_oldest_when_buffer_is_full(monkeypatch):
+    """A stalled worker bounds memory by discarding the oldest telemetry."""
+    from hyh.acp import _BUFFER_SIZE
+
+    monkeypatch.setattr(ACPEmitter, "_worker", lambda self: None)
+    emitter = ACPEmitter(port=59999)
+
+    for i in range(_BUFFER_SIZE + 10):
+        emitter.emit({"index": i})
+
+    assert len(emitter._buffer) == _BUFFER_SIZE
+    assert emitter._buffer[0] == {"index": 10}
+    assert emitter._buffer[-1] == {"index": _BUFFER_SIZE + 9}
@@ -240,3 +240,44 @@ class TestACPWithMockServer:
             if accept_thread.is_alive():
                 server.close()
                 accept_thread.join(timeout=1.0)
+
+
+class TestEncodingFailures:
+    """Unencodable entries are dropped without losing the rest of the batch."""
+
+    def test_circular_reference_does_not_drop_batch(self) -> None:
+        received: list[bytes] = []
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+
+        def accept_connection() -> None:
+            with contextlib.suppress(OSError):
+                conn, _ = server.accept()
+                conn.settimeout(1.0)
+                with contextlib.suppress(OSError):
+                    while data := conn.recv(4096):
+                        received.append(data)
+                conn.close()
+
+        accept_thread = threading.Thread(target=accept_connection, daemon=True)
+        accept_thread.start()
+
+        circular: dict = {"type": "circular"}
+        circular["self"] = circular
+
+        emitter = ACPEmitter("127.0.0.1", port)
+        try:
+            emitter.emit(circular)
+            emitter.emit({"type": "valid"})
+            wait_until(
+                lambda: b"valid" in b"".join(received),
+                timeout=2.0,
+                message="Valid event after an unencodable one should still be sent",
+            )
+        finally:
+            emitter.close()
+            server.close()
+
+        assert b"circular" not in b"".join(received)
@@ -215,6 +215,21 @@ def test_client_git_command(worktree_with_daemon):
     assert response["data"]["returncode"] == 0
 
 
+def test_client_connection_reused_for_multiple_calls(worktree_with_daemon):
+    """_connect spawns the daemon once; the connection then serves several RPCs."""
+    from hyh.client import _connect
+
+    socket_path = worktree_with_daemon["socket"]
+    worktree = worktree_with_daemon["worktree"]
+
+    with _connect(socket_path, str(worktree)) as conn:
+        first = conn.call({"command": "ping"})
+        second = conn.call({"command": "get_state"})
+
+    assert first["status"] == "ok"
+    assert second["data"]["state"]["tasks"]["task-1"]["status"] == "pending"
+
+
 def test_spawn_daemon_detects_crash(tmp_path):
     """spawn_daemon should detect immediate crashes (zombie detection).
 
@@ -248,11 +263,129 @@ def test_spawn_daemon_detects_crash(tmp_path):
         socket_dir.rmdir()
 
 
+def test_spawn_daemon_returns_once_socket_listens(tmp_path):
+    """spawn_daemon is woken by the daemon's ready signal with the socket accepting."""
+    import signal
+    import socket
+
+    from hyh.client import send_rpc, spawn_daemon
+
+    socket_path = f"/tmp/hyh-test-ready-{uuid.uuid4().hex[:8]}.sock"
+    try:
+        spawn_daemon(str(tmp_path), socket_path)
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with probe:
+            probe.connect(socket_path)
+        pid = send_rpc(socket_path, {"command": "ping"}, timeout=5.0)["data"]["pid"]
+        os.kill(pid, signal.SIGTERM)
+    finally:
+        for path in (socket_path, socket_path + ".lock"):
+            if os.path.exists(path):
+                os.unlink(path)
+
+
+@pytest.mark.skipif(not Path("/proc/self/stat").exists(), reason="needs /proc")
+def test_spawn_daemon_leaves_no_child_to_reap(tmp_path):
+    """The running daemon is not a child of the spawning client, so it never goes defunct there."""
+    import signal
+
+    from hyh.client import send_rpc, spawn_daemon
+
+    socket_path = f"/tmp/hyh-test-orphan-{uuid.uuid4().hex[:8]}.sock"
+    try:
+        spawn_daemon(str(tmp_path), socket_path)
+
+        pid = send_rpc(socket_path, {"command": "ping"}, timeout=5.0)["data"]["pid"]
+        try:
+            stat = Path(f"/proc/{pid}/stat").read_text()
+            ppid = int(stat.rsplit(")", 1)[1].split()[1])
+            assert ppid != os.getpid()
+        finally:
+            os.kill(pid, signal.SIGTERM)
+    finally:
+        for path in (socket_path, socket_path + ".lock"):
+            if os.path.exists(path):
+                os.unlink(path)
+
+
+def test_spawn_daemon_reports_crash_before_ready(tmp_path, monkeypatch):
+    """A daemon that fails before listening reports why on the ready pipe, without a timeout."""
+    import time
+
+    from hyh.client import spawn_daemon
+
+    socket_path = str(tmp_path / "missing-dir" / "hyh.sock")
+    monkeypatch.setenv("HYH_TIMEOUT", "30")
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="crashed on startup: FileNotFoundError"):
+        spawn_daemon(str(tmp_path), socket_path)
+    assert time.monotonic() - start < 15.0
+
+
+def test_spawn_daemon_reports_stderr_of_early_crash(tmp_path, monkeypatch):
+    """A daemon that dies before it can use the ready pipe is reported with its stderr."""
+    from hyh.client import spawn_daemon
+
+    fake_python = tmp_path / "python"
+    fake_python.write_text("#!/bin/sh\necho 'ModuleNotFoundError: no msgspec' >&2\nexit 3\n")
+    fake_python.chmod(0o755)
+    monkeypatch.setattr(sys, "executable", str(fake_python))
+
+    with pytest.raises(RuntimeError, match=r"exit status 3\): ModuleNotFoundError: no msgspec"):
+        spawn_daemon(str(tmp_path), str(tmp_path / "hyh.sock"))
+
+
+def test_client_import_defers_command_only_modules():
+    """Modules needed by only some commands load lazily, not at client import."""
+    script = """
+import sys
+import hyh.client
+deferred = ("subprocess", "uuid", "argparse", "importlib.metadata", "hyh.demo")
+print(sorted(m for m in deferred if m in sys.modules))
+"""
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_hook_commands_skip_argparse(tmp_path):
+    """Argument-less hook commands dispatch from argv without importing argparse."""
+    script = """
+import sys
+sys.argv = ["hyh", "worker-id"]
+import hyh.client
+hyh.client.main()
+print("argparse" in sys.modules)
+"""
+    env = {**os.environ, "HYH_WORKER_ID_FILE": str(tmp_path / "worker.id")}
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env)
+
+    assert result.returncode == 0, result.stderr
+    worker_id, argparse_loaded = result.stdout.split()
+    assert worker_id.startswith("worker-")
+    assert argparse_loaded == "False"
+
+
+def test_parse_bare_command_accepts_project_prefix():
+    """The argv fast path handles `--project DIR <cmd>` and defers anything else."""
+    from hyh.client import _parse_bare_command
+
+    bare = _parse_bare_command(["--project", "/repo", "shutdown"])
+    assert bare is not None
+    assert (bare.command, bare.project) == ("shutdown", "/repo")
+
+    assert _parse_bare_command(["check-state"]).project is None
+    assert _parse_bare_command(["status", "--json"]) is None
+    assert _parse_bare_command(["ping", "--help"]) is None
+
+
 class TestWorkerID:
     """Tests for WORKER_ID constant."""
 
-    def test_worker_id_generated_on_import(self):
-        """Client has WORKER_ID constant."""
+    def test_worker_id_resolved_on_first_access(self):
+        """Client exposes WORKER_ID, resolved lazily on first access."""
         import hyh.client as client_module
 
         assert hasattr(client_module, "WORKER_ID")
@@ -260,6 +393,17 @@ class TestWorkerID:
         assert client_module.WORKER_ID.startswith("worker-")
         assert len(client_module.WORKER_ID) == len("worker-") + 12
 
+    def test_import_does_not_touch_worker_id_file(self, tmp_path):
+        """Importing the client must not create or read the worker ID file."""
+        worker_file = tmp_path / "worker.id"
+        env = {**os.environ, "HYH_WORKER_ID_FILE": str(worker_file)}
+        result = subprocess.run(
+            [sys.executable, "-c", "import hyh.client"], capture_output=True, text=True, env=env
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert not worker_file.exists()
+
     def test_worker_id_is_stable(self):
         """WORKER_ID is same within process."""
         import hyh.client as client_module
@@ -502,6 +646,85 @@ def test_get_socket_path_env_override(tmp_path: Path, monkeypatch: pytest.Monkey
     assert get_socket_path(tmp_path) == custom_socket
 
 
+def test_get_git_root_walks_up_to_dot_git(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """_get_git_root finds the enclosing .git by walking parents, without spawning git."""
+    repo = tmp_path / "repo"
+    nested = repo / "src" / "pkg"
+    nested.mkdir(parents=True)
+    (repo / ".git").mkdir()
+
+    monkeypatch.chdir(nested)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+
+    import hyh.client as client_module
+
+    def fail_run(*args, **kwargs):
+        raise AssertionError("git should not be spawned when .git is found")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
+
+    assert client_module._get_git_root() == str(repo.resolve())
+
+
+def test_get_git_root_defers_to_git_when_git_dir_set(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """GIT_DIR changes toplevel resolution, so git itself must answer."""
+    repo = tmp_path / "repo"
+    (repo / ".git").mkdir(parents=True)
+    monkeypatch.chdir(repo)
+    monkeypatch.setenv("GIT_DIR", str(repo / ".git"))
+
+    import hyh.client as client_module
+
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="/elsewhere\n", stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    assert client_module._get_git_root() == "/elsewhere"
+    assert calls == [["git", "rev-parse", "--show-toplevel"]]
+
+
+def test_get_git_root_outside_repo_returns_cwd_without_git(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Outside any repository the walk falls back to cwd; git is never spawned."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+
+    import hyh.client as client_module
+
+    def fail_run(*args, **kwargs):
+        raise AssertionError("git should not be spawned outside a repository")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
+    monkeypatch.setattr(Path, "exists", lambda self: False)
+
+    assert client_module._get_git_root() == str(tmp_path)
+
+
+def test_get_git_root_uses_git_work_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """GIT_WORK_TREE names the toplevel directly."""
+    work_tree = tmp_path / "tree"
+    work_tree.mkdir()
+    monkeypatch.setenv("GIT_WORK_TREE", str(work_tree))
+
+    import hyh.client as client_module
+
+    def fail_run(*args, **kwargs):
+        raise AssertionError("git should not be spawned when GIT_WORK_TREE is set")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
+
+    assert client_module._get_git_root() == str(work_tree.resolve())
+
+
 def test_status_project_flag_overrides_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """--project flag overrides auto-detection from cwd."""
     project_a = tmp_path / "project_a"
@@ -4,12 +4,18 @@ Client Edge Cases Tests.
 Tests for CLI client robustness and error handling.
 """
 
+import json
 import os
+import socket
 import tempfile
+import threading
+import uuid
 from pathlib import Path
 from unittest.mock import patch
 
-from hyh.client import get_socket_path, get_worker_id
+import pytest
+
+from hyh.client import get_socket_path, get_worker_id, send_rpc
 
 
 class TestWorkerIdPersistence:
@@ -71,6 +77,31 @@ class TestWorkerIdPersistence:
                 assert worker_id.startswith("worker-")
                 assert len(worker_id) == 19
 
+    def test_worker_id_file_not_utf8(self) -> None:
+        """Binary garbage in the ID file triggers regeneration, not a crash."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            worker_file = Path(tmpdir) / "worker.id"
+            worker_file.write_bytes(b"\xff\xfe\x00garbage")
+
+            with patch.dict(os.environ, {"HYH_WORKER_ID_FILE": str(worker_file)}):
+                worker_id = get_worker_id()
+
+            assert worker_id.startswith("worker-")
+            assert worker_file.read_text() == worker_id
+
+    def test_worker_id_write_skips_fsync(self) -> None:
+        """The ID file is written via atomic rename alone, without fsync."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            worker_file = Path(tmpdir) / "worker.id"
+
+            with (
+                patch.dict(os.environ, {"HYH_WORKER_ID_FILE": str(worker_file)}),
+                patch("os.fsync", side_effect=AssertionError("fsync called")),
+            ):
+                worker_id = get_worker_id()
+
+            assert worker_file.read_text() == worker_id
+
 
 class TestSocketPathGeneration:
     """Test socket path generation edge cases."""
@@ -124,3 +155,204 @@ class TestSocketPathLength:
 
             # macOS AF_UNIX limit is 104 characters
             assert len(socket_path) < 104, f"Socket path too long: {len(socket_path)} chars"
+
+
+class TestRpcResponseFraming:
+    """Test send_rpc response reassembly."""
+
+    def test_large_response_split_across_chunks(self) -> None:
+        """A response delivered in many small writes is reassembled intact."""
+        socket_path = f"/tmp/hyh-test-chunks-{uuid.uuid4().hex[:8]}.sock"
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+
+        payload = {"status": "ok", "data": {"blob": "x" * 200_000}}
+        encoded = json.dumps(payload).encode() + b"\n"
+
+        def serve() -> None:
+            conn, _ = server.accept()
+            with conn:
+                conn.recv(4096)
+                for i in range(0, len(encoded), 1000):
+                    conn.sendall(encoded[i : i + 1000])
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        try:
+            assert send_rpc(socket_path, {"command": "get_state"}) == payload
+        finally:
+            thread.join(timeout=2.0)
+            server.close()
+            os.unlink(socket_path)
+
+    def test_large_request_survives_short_writes(self) -> None:
+        """A request larger than the socket buffer arrives complete and newline-terminated."""
+        socket_path = f"/tmp/hyh-test-req-{uuid.uuid4().hex[:8]}.sock"
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+
+        request = {"command": "plan_import", "content": "y" * 2_000_000}
+        received = bytearray()
+
+        def serve() -> None:
+            conn, _ = server.accept()
+            with conn:
+                while not received.endswith(b"\n"):
+                    chunk = conn.recv(65536)
+                    if not chunk:
+                        return
+                    received.extend(chunk)
+                conn.sendall(b'{"status": "ok", "data": null}\n')
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        try:
+            assert send_rpc(socket_path, request)["status"] == "ok"
+        finally:
+            thread.join(timeout=2.0)
+            server.close()
+            os.unlink(socket_path)
+
+        assert json.loads(received) == request
+        assert received.startswith(b'{"command":"plan_import",')
+
+    def test_surrogate_escaped_argument_is_sent_escaped(self) -> None:
+        """A non-UTF-8 argv entry reaches the daemon as a JSON escape, not a client crash."""
+        socket_path = f"/tmp/hyh-test-surrogate-{uuid.uuid4().hex[:8]}.sock"
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+
+        received = bytearray()
+
+        def serve() -> None:
+            conn, _ = server.accept()
+            with conn:
+                while not received.endswith(b"\n"):
+                    received.extend(conn.recv(4096))
+                conn.sendall(b'{"status": "error", "message": "Invalid request"}\n')
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        try:
+            response = send_rpc(socket_path, {"command": "exec", "args": ["cat", "\udcff"]})
+        finally:
+            thread.join(timeout=2.0)
+            server.close()
+            os.unlink(socket_path)
+
+        assert response["status"] == "error"
+        assert received.isascii()
+        assert b'"\\udcff"' in received
+
+    def test_silent_daemon_times_out(self) -> None:
+        """A daemon that accepts but never replies raises TimeoutError, not a hang."""
+        socket_path = f"/tmp/hyh-test-silent-{uuid.uuid4().hex[:8]}.sock"
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+
+        try:
+            with pytest.raises(TimeoutError):
+                send_rpc(socket_path, {"command": "ping"}, timeout=0.2)
+        finally:
+            server.close()
+            os.unlink(socket_path)
+
+    def test_connection_fd_blocking_under_default_timeout(self) -> None:
+        """A process-wide default socket timeout does not leave the RPC fd non-blocking."""
+        from hyh.client import _Connection
+
+        socket_path = f"/tmp/hyh-test-block-{uuid.uuid4().hex[:8]}.sock"
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+
+        previous = socket.getdefaulttimeout()
+        socket.setdefaulttimeout(1.0)
+        try:
+            with _Connection(socket_path, timeout=0.5) as conn:
+                assert os.get_blocking(conn._fd)
+        finally:
+            socket.setdefaulttimeout(previous)
+            server.close()
+            os.unlink(socket_path)
+
+
+class TestOlderDaemonFallback:
+    """Hooks keep working against a daemon started by an older client."""
+
+    @pytest.fixture
+    def old_daemon(self):
+        """A daemon that predates task_progress and batch, with 0/1 tasks done."""
+        socket_path = f"/tmp/hyh-test-old-{uuid.uuid4().hex[:8]}.sock"
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(4)
+        state = {"tasks": {"t1": {"id": "t1", "status": "pending"}}, "last_commit": "a" * 40}
+        replies = {
+            "get_state": {"status": "ok", "data": {"state": state}},
+            "git": {
+                "status": "ok",
+                "data": {"returncode": 0, "stdout": "a" * 40 + "\n", "stderr": ""},
+            },
+        }
+        commands: list[str] = []
+
+        def serve() -> None:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    return
+                with conn, conn.makefile("rb") as reader:
+                    for line in reader:
+                        command = json.loads(line)["command"]
+                        commands.append(command)
+                        reply = replies.get(
+                            command,
+                            {"status": "error", "message": f"Invalid request: {command}"},
+                        )
+                        conn.sendall(json.dumps(reply).encode() + b"\n")
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        yield socket_path, commands
+        server.close()
+        os.unlink(socket_path)
+
+    def test_check_state_falls_back_to_get_state(self, old_daemon, capsys) -> None:
+        """An unknown task_progress still gates the Stop hook on the task count."""
+        from hyh.client import _cmd_check_state
+
+        socket_path, commands = old_daemon
+        with pytest.raises(SystemExit) as excinfo:
+            _cmd_check_state(socket_path, "/tmp")
+
+        assert excinfo.value.code == 1
+        assert capsys.readouterr().out.strip() == "deny: Workflow in progress (0/1)"
+        assert commands == ["task_progress", "get_state"]
+
+    def test_session_start_falls_back_to_get_state(self, old_daemon, capsys) -> None:
+        """SessionStart still reports progress from an older daemon."""
+        from hyh.client import _cmd_session_start
+
+        socket_path, _ = old_daemon
+        _cmd_session_start(socket_path, "/tmp")
+
+        output = json.loads(capsys.readouterr().out)
+        assert output["hookSpecificOutput"]["additionalContext"] == "Resuming workflow: task 0/1"
+
+    def test_check_commit_falls_back_to_plain_calls(self, old_daemon, capsys) -> None:
+        """An unknown batch still checks last_commit, over the same connection."""
+        from hyh.client import _cmd_check_commit
+
+        socket_path, commands = old_daemon
+        with pytest.raises(SystemExit) as excinfo:
+            _cmd_check_commit(socket_path, "/tmp")
+
+        assert excinfo.value.code == 1
+        assert capsys.readouterr().out.strip() == "deny: No new commit since aaaaaaa"
+        assert commands == ["batch", "get_state", "git"]
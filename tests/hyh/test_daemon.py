@@ -9,6 +9,7 @@ The daemon provides:
 """
 
 import json
+import os
 import socket
 import sys
 import threading
@@ -502,6 +503,51 @@ def test_handle_task_complete_validates_ownership(daemon_with_state, socket_path
     assert "not owned by" in response["message"]
 
 
+def test_handle_task_progress_counts_completed(daemon_with_state, socket_path):
+    """task_progress returns only the total and completed task counts."""
+    response = send_command(socket_path, {"command": "task_progress"})
+    assert response == {"status": "ok", "data": {"total": 2, "completed": 0}}
+
+    send_command(socket_path, {"command": "task_claim", "worker_id": "worker1"})
+    send_command(
+        socket_path, {"command": "task_complete", "task_id": "task1", "worker_id": "worker1"}
+    )
+
+    response = send_command(socket_path, {"command": "task_progress"})
+    assert response["data"] == {"total": 2, "completed": 1}
+
+
+def test_status_summary_reused_until_state_changes(daemon_with_state, socket_path):
+    """Repeated status polls of unchanged state reuse one summary pass."""
+    daemon, _ = daemon_with_state
+
+    first = send_command(socket_path, {"command": "status"})
+    cached = daemon.summary_cache
+    assert send_command(socket_path, {"command": "status"}) == first
+    assert daemon.summary_cache is cached
+
+    send_command(socket_path, {"command": "task_claim", "worker_id": "worker1"})
+    response = send_command(socket_path, {"command": "status"})
+    assert daemon.summary_cache is not cached
+    assert response["data"]["summary"]["running"] == 1
+    assert response["data"]["active_workers"] == ["worker1"]
+
+
+def test_get_state_reply_reused_until_state_changes(daemon_with_state, socket_path):
+    """Polling unchanged state returns the cached encoding; a claim invalidates it."""
+    daemon, _ = daemon_with_state
+
+    first = send_command(socket_path, {"command": "get_state"})
+    cached = daemon.state_reply_cache
+    assert send_command(socket_path, {"command": "get_state"}) == first
+    assert daemon.state_reply_cache is cached
+
+    send_command(socket_path, {"command": "task_claim", "worker_id": "worker1"})
+    response = send_command(socket_path, {"command": "get_state"})
+    assert daemon.state_reply_cache is not cached
+    assert response["data"]["state"]["tasks"]["task1"]["status"] == "running"
+
+
 def test_task_claim_logs_trajectory_after_state_update(daemon_with_state, socket_path, worktree):
     """task_claim should log to trajectory AFTER state update (lock convoy fix)."""
     daemon, worktree_path = daemon_with_state
@@ -652,6 +698,28 @@ def test_exec_trajectory_log_truncation_limit(daemon_with_state, socket_path, wo
         )
 
 
+def test_exec_timeout_returns_partial_output(daemon_with_state, socket_path):
+    """A timed-out exec still replies with the output produced before the kill."""
+    script = "import sys, time; print('started', flush=True); time.sleep(10)"
+    response = send_command(
+        socket_path,
+        {"command": "exec", "args": [sys.executable, "-c", script], "timeout": 1.0},
+    )
+
+    assert response["status"] == "ok"
+    assert response["data"]["stdout"] == "started\n"
+    assert response["data"]["signal_name"] == "SIGTERM"
+
+
+def test_timeout_output_accepts_bytes_text_and_none():
+    """Timeout output is text whichever runtime path raised TimeoutExpired."""
+    from hyh.daemon import _timeout_output
+
+    assert _timeout_output(b"ok\xff") == "ok\ufffd"
+    assert _timeout_output("already text") == "already text"
+    assert _timeout_output(None) == ""
+
+
 def test_plan_import_handler(daemon_manager):
     """plan_import should parse Markdown and seed state."""
     daemon, _ = daemon_manager
@@ -781,6 +849,90 @@ def test_handle_empty_request_line(daemon_manager):
     assert resp["status"] == "ok"
 
 
+def test_handle_serves_multiple_requests_per_connection(daemon_manager):
+    """One connection can carry several newline-delimited requests."""
+    daemon, _ = daemon_manager
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(5.0)
+    sock.connect(daemon.socket_path)
+    try:
+        reader = sock.makefile("rb")
+        responses = []
+        for command in ({"command": "ping"}, {"command": "get_state"}, {"command": "ping"}):
+            sock.sendall(json.dumps(command).encode() + b"\n")
+            responses.append(json.loads(reader.readline()))
+        reader.close()
+    finally:
+        sock.close()
+
+    assert [r["status"] for r in responses] == ["ok", "ok", "ok"]
+    assert responses[0]["data"]["running"] is True
+    assert "state" in responses[1]["data"]
+
+
+def test_compact_ping_matches_decoded_ping(daemon_manager):
+    """The pre-encoded ping fast path answers exactly like a decoded ping."""
+    daemon, _ = daemon_manager
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(5.0)
+    sock.connect(daemon.socket_path)
+    try:
+        reader = sock.makefile("rb")
+        sock.sendall(b'{"command":"ping"}\n')
+        fast = reader.readline()
+        sock.sendall(b'{"command": "ping"}\n')
+        decoded = reader.readline()
+        reader.close()
+    finally:
+        sock.close()
+
+    assert fast == decoded == daemon.ping_reply
+    assert json.loads(fast)["data"]["pid"] == os.getpid()
+
+
+def test_batch_returns_one_result_per_call(daemon_manager):
+    """Batch runs each call in order and isolates invalid entries."""
+    daemon, _ = daemon_manager
+    response = send_command(
+        daemon.socket_path,
+        {
+            "command": "batch",
+            "calls": [{"command": "ping"}, {"command": "nope"}, {"command": "get_state"}],
+        },
+    )
+
+    assert response["status"] == "ok"
+    ping, invalid, state = response["data"]["results"]
+    assert ping["data"]["running"] is True
+    assert invalid["status"] == "error"
+    assert "Invalid request" in invalid["message"]
+    assert state["status"] == "ok"
+
+
+def test_batch_rejects_nested_batch_and_shutdown(daemon_manager):
+    """Batch and shutdown entries fail on their own and leave the daemon serving."""
+    daemon, _ = daemon_manager
+    response = send_command(
+        daemon.socket_path,
+        {
+            "command": "batch",
+            "calls": [
+                {"command": "batch", "calls": [{"command": "ping"}]},
+                {"command": "shutdown"},
+                {"command": "ping"},
+            ],
+        },
+    )
+
+    nested, shutdown, ping = response["data"]["results"]
+    assert nested["status"] == "error"
+    assert shutdown["status"] == "error"
+    assert "not allowed inside a batch" in shutdown["message"]
+    assert ping["status"] == "ok"
+    assert not daemon.shutdown_requested.is_set()
+    assert send_command(daemon.socket_path, {"command": "ping"})["status"] == "ok"
+
+
 def test_handle_malformed_json_request(daemon_manager):
     """Handler should return error for malformed JSON."""
     daemon, _ = daemon_manager
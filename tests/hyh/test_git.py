@@ -266,3 +266,57 @@ def test_safe_git_exec_read_only_skips_lock():
         assert execute_calls[-1]["exclusive"] is True, (
             "read_only=False (default) should pass exclusive=True"
         )
+
+
+def _git(cwd, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _init_repo_with_commit(path) -> None:
+    _git(path, "init", "-q")
+    _git(path, "config", "user.email", "test@test.com")
+    _git(path, "config", "user.name", "Test")
+    _git(path, "commit", "-q", "--allow-empty", "-m", "initial")
+
+
+def test_read_head_sha_matches_git(tmp_path):
+    """read_head_sha resolves loose, packed and detached HEADs like git does."""
+    from hyh.git import read_head_sha
+
+    _init_repo_with_commit(tmp_path)
+    subdir = tmp_path / "nested" / "dir"
+    subdir.mkdir(parents=True)
+    assert read_head_sha(str(subdir)) == _git(tmp_path, "rev-parse", "HEAD")
+
+    _git(tmp_path, "pack-refs", "--all")
+    assert read_head_sha(str(tmp_path)) == _git(tmp_path, "rev-parse", "HEAD")
+
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "second")
+    _git(tmp_path, "checkout", "-q", "--detach")
+    assert read_head_sha(str(tmp_path)) == _git(tmp_path, "rev-parse", "HEAD")
+
+
+def test_read_head_sha_linked_worktree(tmp_path):
+    """Linked worktrees resolve HEAD through their .git file and commondir."""
+    from hyh.git import read_head_sha
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo_with_commit(repo)
+    linked = tmp_path / "linked"
+    _git(repo, "worktree", "add", "-q", "-b", "feature", str(linked))
+    _git(linked, "commit", "-q", "--allow-empty", "-m", "on feature")
+
+    assert read_head_sha(str(linked)) == _git(linked, "rev-parse", "HEAD")
+    assert read_head_sha(str(linked)) != read_head_sha(str(repo))
+
+
+def test_read_head_sha_unborn_branch_returns_none(tmp_path):
+    """A repository without commits has no HEAD to resolve."""
+    from hyh.git import read_head_sha
+
+    _git(tmp_path, "init", "-q")
+
+    assert read_head_sha(str(tmp_path)) is None
@@ -265,6 +265,75 @@ def test_cli_get_state_without_workflow(integration_worktree):
     assert "No active workflow" in result.stdout
 
 
+def test_check_commit_uses_single_connection(integration_worktree, monkeypatch, capsys):
+    """check-commit batches its state and HEAD lookups into one round-trip."""
+    import hyh.client as client_module
+    from hyh.state import Task, WorkflowState, WorkflowStateStore
+
+    worktree = integration_worktree["worktree"]
+    socket_path = integration_worktree["socket"]
+    WorkflowStateStore(worktree).save(
+        WorkflowState(tasks={"task-1": Task(id="task-1", description="First task")})
+    )
+
+    connections = []
+    real_connection = client_module._Connection
+
+    def counting_connection(*args, **kwargs):
+        conn = real_connection(*args, **kwargs)
+        connections.append(conn)
+        return conn
+
+    monkeypatch.setattr(client_module, "_Connection", counting_connection)
+    monkeypatch.chdir(worktree)
+
+    client_module._cmd_check_commit(socket_path, str(worktree))
+
+    assert capsys.readouterr().out.strip() == "allow"
+    assert len(connections) == 1
+
+
+def test_status_watch_reuses_connection(integration_worktree, monkeypatch, capsys):
+    """status --watch refreshes over one daemon connection."""
+    from types import SimpleNamespace
+
+    import hyh.client as client_module
+    from hyh.state import Task, WorkflowState, WorkflowStateStore
+
+    worktree = integration_worktree["worktree"]
+    socket_path = integration_worktree["socket"]
+    WorkflowStateStore(worktree).save(
+        WorkflowState(tasks={"task-1": Task(id="task-1", description="First task")})
+    )
+
+    connections = []
+    real_connection = client_module._Connection
+
+    def counting_connection(*args, **kwargs):
+        conn = real_connection(*args, **kwargs)
+        connections.append(conn)
+        return conn
+
+    refreshes = 0
+
+    def fake_sleep(_seconds):
+        nonlocal refreshes
+        refreshes += 1
+        if refreshes == 3:
+            raise KeyboardInterrupt
+
+    # Start the daemon first: spawn_daemon's readiness wait may sleep too
+    client_module.send_rpc(socket_path, {"command": "ping"}, str(worktree))
+    monkeypatch.setattr(client_module, "_Connection", counting_connection)
+    monkeypatch.setattr(client_module.time, "sleep", fake_sleep)
+
+    args = SimpleNamespace(all=False, json=True, watch=1)
+    client_module._cmd_status(args, socket_path, str(worktree))
+
+    assert capsys.readouterr().out.count('"active": true') == 3
+    assert len(connections) == 1
+
+
 def test_cli_update_state(integration_worktree):
     """Test update-state command works correctly."""
     from hyh.state import Task, TaskStatus, WorkflowState, WorkflowStateStore
@@ -12,6 +12,7 @@ Tests cover:
 
 import os
 import subprocess
+import sys
 import threading
 from unittest.mock import MagicMock, patch
 
@@ -210,6 +211,44 @@ class TestLocalRuntime:
 
         assert result.returncode != 0
 
+    def test_execute_output_limit_keeps_tail(self):
+        """output_limit bounds captured output to the last bytes of each stream."""
+        from hyh.runtime import LocalRuntime
+
+        runtime = LocalRuntime()
+        script = "import sys; sys.stdout.write('a' * 500000 + 'END'); sys.stderr.write('err')"
+        result = runtime.execute([sys.executable, "-c", script], output_limit=1000)
+
+        assert result.returncode == 0
+        assert len(result.stdout) == 1000
+        assert result.stdout.endswith("aEND")
+        assert result.stderr == "err"
+
+    def test_execute_output_limit_honours_timeout(self):
+        """The capped capture path still kills and raises on timeout."""
+        from hyh.runtime import LocalRuntime
+
+        runtime = LocalRuntime()
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            runtime.execute(["sleep", "10"], timeout=0.1, output_limit=1000)
+
+    def test_execute_output_limit_timeout_carries_decoded_tail(self):
+        """Partial output on timeout arrives as text, invalid UTF-8 replaced."""
+        from hyh.runtime import LocalRuntime
+
+        runtime = LocalRuntime()
+        script = (
+            "import sys, time; sys.stdout.buffer.write(b'ok\\xff\\r\\n'); "
+            "sys.stdout.flush(); time.sleep(10)"
+        )
+
+        with pytest.raises(subprocess.TimeoutExpired) as excinfo:
+            runtime.execute([sys.executable, "-c", script], timeout=1.0, output_limit=1000)
+
+        assert excinfo.value.stdout == "ok\ufffd\n"
+        assert excinfo.value.stderr == ""
+
     def test_execute_with_cwd(self):
         """LocalRuntime should execute commands in specified cwd."""
         from hyh.runtime import LocalRuntime
@@ -244,6 +244,35 @@ class TestSignalHandling:
             with contextlib.suppress(Exception):
                 daemon.server_close()
 
+    def test_shutdown_stops_server_after_reply_is_sent(
+        self, socket_path: str, worktree: Path
+    ) -> None:
+        """The shutdown reply reaches the client before the server stops serving."""
+        from hyh.daemon import HarnessDaemon
+
+        daemon = HarnessDaemon(socket_path, str(worktree))
+        server_thread = threading.Thread(target=daemon.serve_forever)
+        server_thread.daemon = True
+        server_thread.start()
+        wait_for_socket(socket_path)
+
+        try:
+            sock = socket_module.socket(socket_module.AF_UNIX, socket_module.SOCK_STREAM)
+            sock.settimeout(5.0)
+            sock.connect(socket_path)
+            with sock, sock.makefile("rb") as reader:
+                sock.sendall(b'{"command": "ping"}\n{"command": "shutdown"}\n')
+                ping = json.loads(reader.readline())
+                shutdown = json.loads(reader.readline())
+            assert ping["data"]["running"] is True
+            assert shutdown["data"]["shutdown"] is True
+
+            server_thread.join(timeout=2)
+            assert not server_thread.is_alive(), "Server should have stopped"
+        finally:
+            with contextlib.suppress(Exception):
+                daemon.server_close()
+
 
 # -----------------------------------------------------------------------------
 # Complexity Analysis
@@ -1099,6 +1099,40 @@ def test_state_manager_caches_state_in_memory(tmp_path):
     assert result.task is not None, "StateManager should use cached state, not re-read from disk"
 
 
+def test_load_reuses_snapshot_until_file_changes(tmp_path):
+    """load() serves the cached snapshot while the file is unchanged, then re-reads."""
+    manager = WorkflowStateStore(tmp_path)
+    manager.save(WorkflowState(tasks={"task-1": Task(id="task-1", description="Task 1")}))
+
+    first = manager.load()
+    assert manager.load() is first
+
+    # A different writer replaces the file: the next load picks it up
+    WorkflowStateStore(tmp_path).save(
+        WorkflowState(tasks={"task-2": Task(id="task-2", description="Task 2")})
+    )
+    reloaded = manager.load()
+    assert reloaded is not None
+    assert list(reloaded.tasks) == ["task-2"]
+
+    manager.state_file.unlink()
+    assert manager.load() is None
+
+
+def test_save_validated_skips_dag_walk(tmp_path, monkeypatch):
+    """save(validated=True) trusts a DAG the caller already checked."""
+    manager = WorkflowStateStore(tmp_path)
+    state = WorkflowState(tasks={"task-1": Task(id="task-1", description="Task 1")})
+
+    def fail() -> None:
+        raise AssertionError("validate_dag called")
+
+    monkeypatch.setattr(WorkflowState, "validate_dag", lambda self: fail())
+    manager.save(state, validated=True)
+
+    assert json.loads(manager.state_file.read_bytes())["tasks"]["task-1"]["id"] == "task-1"
+
+
 # ============================================================================
 # TestDetectCycle: standalone cycle detection function (Task 3)
 # ============================================================================
@@ -50,6 +50,16 @@ def test_appends_jsonl(temp_trajectory_dir, logger):
     assert json.loads(lines[2]) == {"event": "event3", "value": 3}
 
 
+def test_lines_are_compact_utf8(temp_trajectory_dir, logger):
+    """Events are written without separator padding or ASCII escapes."""
+    logger.log({"event": "note", "text": "café"})
+
+    trajectory_file = temp_trajectory_dir / ".claude" / "trajectory.jsonl"
+    raw = trajectory_file.read_bytes()
+
+    assert raw == '{"event":"note","text":"café"}\n'.encode()
+
+
 def test_thread_safe(temp_trajectory_dir, logger):
     """Test that concurrent writes are thread-safe."""
     num_threads = 10
@@ -195,10 +205,12 @@ def test_trajectory_tail_handles_decode_error(tmp_path):
 
 
 def test_log_calls_fsync_for_durability(temp_trajectory_dir, logger):
-    """Test that log() calls fsync to ensure durability on crash.
+    """Test that logged events are fsynced to ensure durability on crash.
 
     Per System Reliability Protocol: Assume the process will crash at any nanosecond.
-    Without fsync, data may be lost in OS buffers on crash.
+    Without fsync, data may be lost in OS buffers on crash. The append is
+    synchronous; the fsync runs on the logger's sync thread, and close()
+    waits for it.
     """
 
     original_fsync = os.fsync
@@ -211,6 +223,7 @@ def test_log_calls_fsync_for_durability(temp_trajectory_dir, logger):
 
     with patch("os.fsync", track_fsync):
         logger.log({"event": "test_durability"})
+        logger.close()
 
     assert len(fsync_calls) >= 1, "fsync must be called for crash durability"
 
@@ -383,3 +396,22 @@ def test_log_does_not_hold_lock_during_fsync(tmp_path):
         )
     finally:
         os.fsync = original_fsync
+
+
+def test_log_returns_before_fsync(temp_trajectory_dir, logger):
+    """log() appends synchronously but leaves the fsync to the sync thread."""
+    release = threading.Event()
+    original_fsync = os.fsync
+
+    def slow_fsync(fd):
+        release.wait(timeout=5.0)
+        return original_fsync(fd)
+
+    with patch("os.fsync", slow_fsync):
+        logger.log({"event": "first"})
+        logger.log({"event": "second"})
+
+        # Both appends are readable while the fsync is still blocked
+        assert [e["event"] for e in logger.tail(2)] == ["first", "second"]
+        release.set()
+        logger.close()